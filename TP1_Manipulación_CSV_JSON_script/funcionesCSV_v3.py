@@ -1,281 +1,1164 @@
-import csv
-import os
-import json
-
-# FUNCIÓN PARA LEER CSV
-def csv_a_diccionarios(archivo):
-    """
-    Lee un archivo CSV y retorna una lista de diccionarios
-    """
-    try:
-        with open(archivo, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            return list(reader)
-    except FileNotFoundError:
-        print(f"Error: El archivo '{archivo}' no existe.")
-        return []
-    except Exception as e:
-        print(f"Error al leer el archivo: {e}")
-        return []
-
-# FUNCIÓN PARA AGREGAR REGISTROS
-def agregar_registro(archivo, nuevo_registro):
-    """
-    Agrega un nuevo registro al archivo CSV
-    """
-    try:
-        # Verificar si el archivo existe para determinar si hay que escribir encabezados
-        archivo_existe = os.path.isfile(archivo)
-        
-        with open(archivo, 'a', newline='', encoding='utf-8') as file:
-            campos = nuevo_registro.keys()
-            writer = csv.DictWriter(file, fieldnames=campos)
-            
-            # Escribir encabezados solo si el archivo no existe
-            if not archivo_existe:
-                writer.writeheader()
-            
-            writer.writerow(nuevo_registro)
-        
-        print(f"Registro agregado exitosamente al archivo '{archivo}': {nuevo_registro}")
-        return True
-    except Exception as e:
-        print(f"Error al agregar registro: {e}")
-        return False
-
-# FUNCIÓN PARA BORRAR REGISTROS
-def borrar_por_indice(archivo, indices):
-    """
-    Borra registros por sus índices (empezando desde 0)
-    indices: lista de índices a borrar
-    """
-    try:
-        if not isinstance(indices, list):
-            indices = [indices]
-        
-        registros_restantes = []
-        registros_borrados = 0
-        
-        with open(archivo, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            encabezados = reader.fieldnames
-            registros = list(reader)
-        
-        # Filtrar por índices
-        for i, registro in enumerate(registros):
-            if i not in indices:
-                registros_restantes.append(registro)
-            else:
-                registros_borrados += 1
-        
-        # Escribir de vuelta
-        with open(archivo, 'w', newline='', encoding='utf-8') as file:
-            writer = csv.DictWriter(file, fieldnames=encabezados)
-            writer.writeheader()
-            writer.writerows(registros_restantes)
-        
-        print(f"Se borraron {registros_borrados} registros del archivo '{archivo}'")
-        return registros_borrados
-    except FileNotFoundError:
-        print(f"Error: El archivo '{archivo}' no existe.")
-        return 0
-    except Exception as e:
-        print(f"Error al borrar registros: {e}")
-        return 0
-
-# FUNCIÓN PARA MODIFICAR REGISTROS
-def modificar_interactivo(archivo):
-    """
-    Función interactiva para modificar registros
-    """
-    try:
-        if not os.path.exists(archivo):
-            print(f"Error: El archivo '{archivo}' no existe")
-            return False
-        
-        # Leer registros
-        with open(archivo, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            encabezados = reader.fieldnames
-            registros = list(reader)
-        
-        if not registros:
-            print("El archivo no contiene registros")
-            return False
-        
-        # Mostrar registros
-        print(f"\n--- REGISTROS EXISTENTES EN '{archivo}' ---")
-        for i, registro in enumerate(registros):
-            print(f"{i}: {registro}")
-        
-        # Seleccionar registro
-        try:
-            indice = int(input("\nIngrese el índice del registro a modificar: "))
-            if indice < 0 or indice >= len(registros):
-                print("Índice inválido")
-                return False
-            
-            registro_seleccionado = registros[indice]
-            print(f"\nRegistro seleccionado: {registro_seleccionado}")
-            
-            # Mostrar campos disponibles
-            print("\nCampos disponibles:", encabezados)
-            
-            # Seleccionar campo a modificar
-            campo = input("Ingrese el campo a modificar: ")
-            if campo not in encabezados:
-                print("Campo inválido")
-                return False
-            
-            # Nuevo valor
-            nuevo_valor = input(f"Ingrese nuevo valor para '{campo}': ")
-            
-            # Confirmar
-            print(f"\nCambio: {campo} = '{registro_seleccionado[campo]}' -> '{nuevo_valor}'")
-            confirmacion = input("¿Confirmar modificación? (s/n): ")
-            
-            if confirmacion.lower() == 's':
-                # Aplicar cambio
-                registros[indice][campo] = nuevo_valor
-                
-                # Escribir de vuelta
-                with open(archivo, 'w', newline='', encoding='utf-8') as file:
-                    writer = csv.DictWriter(file, fieldnames=encabezados)
-                    writer.writeheader()
-                    writer.writerows(registros)
-                
-                print("Registro modificado exitosamente")
-                return True
-            else:
-                print("Modificación cancelada")
-                return False
-                
-        except ValueError:
-            print("Entrada inválida")
-            return False
-        except Exception as e:
-            print(f"Error: {e}")
-            return False
-    except Exception as e:
-        print(f"Error al modificar registros: {e}")
-        return False
-    
-
-
-# FUNCIÓN PARA LEER JSON
-def json_a_diccionarios(archivo):
-    """
-    Lee un archivo JSON y retorna una lista de diccionarios
-    """
-    try:
-        with open(archivo, 'r', encoding='utf-8') as file:
-            return json.load(file)
-    except FileNotFoundError:
-        print(f"Error: El archivo '{archivo}' no existe.")
-        return []
-    except Exception as e:
-        print(f"Error al leer el archivo JSON: {e}")
-        return []
-
-# FUNCIÓN PARA AGREGAR REGISTROS EN JSON
-def agregar_registro_json(archivo, nuevo_registro):
-    """
-    Agrega un nuevo registro al archivo JSON
-    """
-    try:
-        datos_existentes = json_a_diccionarios(archivo)
-        datos_existentes.append(nuevo_registro)
-        
-        with open(archivo, 'w', encoding='utf-8') as file:
-            json.dump(datos_existentes, file, indent=4, ensure_ascii=False)
-        
-        print(f"Registro agregado exitosamente al archivo '{archivo}': {nuevo_registro}")
-        return True
-    except Exception as e:
-        print(f"Error al agregar registro JSON: {e}")
-        return False
-
-# FUNCIÓN PARA BORRAR REGISTROS EN JSON
-def borrar_por_indice_json(archivo, indices):
-    """
-    Borra registros por sus índices en archivo JSON
-    """
-    try:
-        if not isinstance(indices, list):
-            indices = [indices]
-        
-        datos = json_a_diccionarios(archivo)
-        registros_borrados = 0
-        
-        # Filtrar registros
-        datos_actualizados = [
-            registro for i, registro in enumerate(datos)
-            if i not in indices
-        ]
-        registros_borrados = len(datos) - len(datos_actualizados)
-        
-        with open(archivo, 'w', encoding='utf-8') as file:
-            json.dump(datos_actualizados, file, indent=4, ensure_ascii=False)
-        
-        print(f"Se borraron {registros_borrados} registros del archivo '{archivo}'")
-        return registros_borrados
-    except Exception as e:
-        print(f"Error al borrar registros JSON: {e}")
-        return 0
-
-# FUNCIÓN PARA MODIFICAR REGISTROS EN JSON
-def modificar_interactivo_json(archivo):
-    """
-    Función interactiva para modificar registros en JSON
-    """
-    try:
-        datos = json_a_diccionarios(archivo)
-        
-        if not datos:
-            print("El archivo no contiene registros")
-            return False
-        
-        print(f"\n--- REGISTROS EXISTENTES EN '{archivo}' ---")
-        for i, registro in enumerate(datos):
-            print(f"{i}: {registro}")
-        
-        try:
-            indice = int(input("\nIngrese el índice del registro a modificar: "))
-            if indice < 0 or indice >= len(datos):
-                print("Índice inválido")
-                return False
-            
-            registro_seleccionado = datos[indice]
-            print(f"\nRegistro seleccionado: {registro_seleccionado}")
-            
-            campos = list(registro_seleccionado.keys())
-            print("\nCampos disponibles:", campos)
-            
-            campo = input("Ingrese el campo a modificar: ")
-            if campo not in campos:
-                print("Campo inválido")
-                return False
-            
-            nuevo_valor = input(f"Ingrese nuevo valor para '{campo}': ")
-            
-            print(f"\nCambio: {campo} = '{registro_seleccionado[campo]}' -> '{nuevo_valor}'")
-            confirmacion = input("¿Confirmar modificación? (s/n): ")
-            
-            if confirmacion.lower() == 's':
-                datos[indice][campo] = nuevo_valor
-                
-                with open(archivo, 'w', encoding='utf-8') as file:
-                    json.dump(datos, file, indent=4, ensure_ascii=False)
-                
-                print("Registro modificado exitosamente")
-                return True
-            else:
-                print("Modificación cancelada")
-                return False
-                
-        except ValueError:
-            print("Entrada inválida")
-            return False
-    except Exception as e:
-        print(f"Error al modificar registros JSON: {e}")
-        return False
\ No newline at end of file
+import csv
+import os
+import io
+import json
+import itertools
+import mmap
+import shutil
+import tempfile
+from array import array
+from instrumentacion import instrumentar
+
+# FUNCIÓN PARA LEER CSV
+@instrumentar(bytes_archivo='lectura')
+def csv_a_diccionarios(archivo):
+    """
+    Lee un archivo CSV y retorna una lista de diccionarios
+    """
+    return list(iterar_csv(archivo))
+
+# FUNCIÓN PARA RECORRER CSV SIN CARGARLO EN MEMORIA
+def iterar_csv(archivo):
+    """
+    Generador que devuelve los registros del CSV de a uno (como diccionarios),
+    sin cargar el archivo completo en memoria
+    """
+    try:
+        with open(archivo, 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            for registro in reader:
+                yield registro
+    except FileNotFoundError:
+        print(f"Error: El archivo '{archivo}' no existe.")
+    except Exception as e:
+        print(f"Error al leer el archivo: {e}")
+
+# FUNCIÓN PARA LEER CSV POR BLOQUES
+def csv_por_bloques(archivo, tamanio_bloque=1000):
+    """
+    Generador que devuelve los registros del CSV en listas de hasta
+    'tamanio_bloque' diccionarios
+    """
+    bloque = []
+    for registro in iterar_csv(archivo):
+        bloque.append(registro)
+        if len(bloque) >= tamanio_bloque:
+            yield bloque
+            bloque = []
+    if bloque:
+        yield bloque
+
+# FUNCIÓN PARA CONTAR REGISTROS CSV
+@instrumentar(bytes_archivo='lectura')
+def contar_registros_csv(archivo):
+    """
+    Cuenta los registros de un CSV recorriéndolo sin guardarlos en memoria
+    """
+    return sum(1 for _ in iterar_csv(archivo))
+
+# FUNCIÓN PARA AGREGAR REGISTROS
+@instrumentar(bytes_archivo='agregado')
+def agregar_registro(archivo, nuevo_registro):
+    """
+    Agrega un nuevo registro al archivo CSV
+    """
+    try:
+        # Verificar si el archivo existe para determinar si hay que escribir encabezados
+        archivo_existe = os.path.isfile(archivo)
+        
+        # Si hay índice vigente se actualiza con el nuevo registro en lugar de reconstruirlo
+        indice = cargar_indice(archivo) if archivo_existe and os.path.exists(ruta_indice(archivo)) else None
+        
+        with open(archivo, 'a', newline='', encoding='utf-8') as file:
+            campos = nuevo_registro.keys()
+            writer = csv.DictWriter(file, fieldnames=campos)
+            
+            # Escribir encabezados solo si el archivo no existe
+            if not archivo_existe:
+                writer.writeheader()
+            
+            file.flush()
+            offset = file.tell()
+            writer.writerow(nuevo_registro)
+        
+        if indice is not None:
+            _agregar_al_indice(archivo, indice, {str(nuevo_registro.get(indice['campo_id'], '')): offset})
+        
+        print(f"Registro agregado exitosamente al archivo '{archivo}': {nuevo_registro}")
+        return True
+    except Exception as e:
+        print(f"Error al agregar registro: {e}")
+        return False
+
+# FUNCIÓN PARA AGREGAR VARIOS REGISTROS
+@instrumentar(bytes_archivo='agregado')
+def agregar_registros(archivo, registros):
+    """
+    Agrega muchos registros al archivo CSV abriéndolo una sola vez
+    registros: cualquier iterable de diccionarios
+    Si algún registro tiene campos que no existen en el archivo no se agrega ninguno:
+    el archivo vuelve a su tamaño original
+    Retorna la cantidad de registros agregados
+    """
+    try:
+        existia = os.path.isfile(archivo)
+        archivo_existe = existia and os.path.getsize(archivo) > 0
+        registros = iter(registros)
+        primero = next(registros, None)
+        if primero is None:
+            print(f"No se agregaron registros al archivo '{archivo}'")
+            return 0
+        registros = itertools.chain([primero], registros)
+        
+        # Los encabezados se toman del archivo existente o del primer registro
+        if archivo_existe:
+            with open(archivo, 'r', encoding='utf-8', newline='') as file:
+                encabezados = csv.DictReader(file).fieldnames
+            sobrantes = [campo for campo in primero if campo not in encabezados]
+            if sobrantes:
+                print(f"Error: los campos {sobrantes} no existen en '{archivo}'. Campos válidos: {encabezados}")
+                return 0
+        else:
+            encabezados = list(primero.keys())
+        
+        indice = cargar_indice(archivo) if archivo_existe and os.path.exists(ruta_indice(archivo)) else None
+        
+        # Cada fila se arma en un buffer para conocer su tamaño en bytes y registrar su offset
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=encabezados)
+        agregados = 0
+        nuevas = {}
+        
+        with open(archivo, 'ab') as file:
+            tamanio_original = file.tell()
+            try:
+                if not archivo_existe:
+                    writer.writeheader()
+                    file.write(buffer.getvalue().encode('utf-8'))
+                offset = file.tell()
+                
+                for numero, registro in enumerate(registros, start=1):
+                    sobrantes = [campo for campo in registro if campo not in encabezados]
+                    if sobrantes:
+                        raise ValueError(f"el registro {numero} tiene los campos {sobrantes}. Campos válidos: {encabezados}")
+                    buffer.seek(0)
+                    buffer.truncate()
+                    writer.writerow(registro)
+                    datos = buffer.getvalue().encode('utf-8')
+                    file.write(datos)
+                    
+                    if indice is not None:
+                        nuevas[str(registro.get(indice['campo_id'], ''))] = offset
+                    
+                    offset += len(datos)
+                    agregados += 1
+            except BaseException:
+                # Se descarta lo escrito para no dejar agregados a medias
+                file.truncate(tamanio_original)
+                raise
+        
+        if indice is not None:
+            _agregar_al_indice(archivo, indice, nuevas)
+        
+        print(f"Se agregaron {agregados} registros al archivo '{archivo}'")
+        return agregados
+    except ValueError as e:
+        print(f"Error: hay registros con campos que no existen en '{archivo}', no se agregó ninguno: {e}")
+        return 0
+    except Exception as e:
+        print(f"Error al agregar registros, no se agregó ninguno: {e}")
+        return 0
+    finally:
+        if not existia and os.path.isfile(archivo) and os.path.getsize(archivo) == 0:
+            os.remove(archivo)
+
+# FUNCIÓN PARA BORRAR REGISTROS
+@instrumentar(bytes_archivo='reescritura')
+def borrar_por_indice(archivo, indices):
+    """
+    Borra registros por sus índices (empezando desde 0)
+    indices: lista de índices a borrar
+    Copia los registros restantes a un archivo temporal en una sola pasada
+    y luego reemplaza el original
+    """
+    archivo_temporal = None
+    try:
+        if not isinstance(indices, (list, set, tuple)):
+            indices = [indices]
+        indices = set(indices)
+        
+        registros_borrados = 0
+        directorio = os.path.dirname(os.path.abspath(archivo))
+        
+        with open(archivo, 'r', encoding='utf-8', newline='') as file:
+            reader = csv.DictReader(file)
+            encabezados = reader.fieldnames
+            
+            with tempfile.NamedTemporaryFile('w', newline='', encoding='utf-8', dir=directorio,
+                                             suffix='.tmp', delete=False) as temporal:
+                archivo_temporal = temporal.name
+                writer = csv.DictWriter(temporal, fieldnames=encabezados)
+                writer.writeheader()
+                
+                # Copiar solo los registros que no se borran
+                for i, registro in enumerate(reader):
+                    if i in indices:
+                        registros_borrados += 1
+                    else:
+                        writer.writerow(registro)
+        
+        # Reemplazar el archivo original de forma atómica
+        os.replace(archivo_temporal, archivo)
+        archivo_temporal = None
+        actualizar_indice(archivo)
+        
+        print(f"Se borraron {registros_borrados} registros del archivo '{archivo}'")
+        return registros_borrados
+    except FileNotFoundError:
+        print(f"Error: El archivo '{archivo}' no existe.")
+        return 0
+    except Exception as e:
+        print(f"Error al borrar registros: {e}")
+        return 0
+    finally:
+        if archivo_temporal and os.path.exists(archivo_temporal):
+            os.remove(archivo_temporal)
+
+# FUNCIÓN PARA PEDIR UN CAMBIO POR TERMINAL
+def pedir_cambio_interactivo(archivo, registros, total, obtener_registro, campos=None):
+    """
+    Muestra los registros y pide por terminal el índice, el campo y el nuevo valor.
+    Retorna los cambios en el formato {indice: {campo: valor}} o None si se cancela
+    registros: iterable con los registros a mostrar (pueden ser solo los primeros)
+    obtener_registro: función que recibe un índice y retorna ese registro
+    campos: campos válidos; si es None se usan los del registro elegido
+    """
+    print(f"\n--- REGISTROS EXISTENTES EN '{archivo}' ---")
+    mostrados = 0
+    for i, registro in enumerate(registros):
+        print(f"{i}: {registro}")
+        mostrados += 1
+    if mostrados < total:
+        print(f"... y {total - mostrados} registros más (índices de 0 a {total - 1})")
+    
+    try:
+        indice = int(input("\nIngrese el índice del registro a modificar: "))
+    except ValueError:
+        print("Entrada inválida")
+        return None
+    if indice < 0 or indice >= total:
+        print("Índice inválido")
+        return None
+    
+    registro_seleccionado = obtener_registro(indice)
+    print(f"\nRegistro seleccionado: {registro_seleccionado}")
+    
+    # Mostrar campos disponibles
+    campos = list(campos) if campos else list(registro_seleccionado.keys())
+    print("\nCampos disponibles:", campos)
+    
+    # Seleccionar campo a modificar
+    campo = input("Ingrese el campo a modificar: ")
+    if campo not in campos:
+        print("Campo inválido")
+        return None
+    
+    # Nuevo valor
+    nuevo_valor = input(f"Ingrese nuevo valor para '{campo}': ")
+    
+    # Confirmar
+    print(f"\nCambio: {campo} = '{registro_seleccionado.get(campo, '')}' -> '{nuevo_valor}'")
+    confirmacion = input("¿Confirmar modificación? (s/n): ")
+    
+    if confirmacion.lower() != 's':
+        print("Modificación cancelada")
+        return None
+    return {indice: {campo: nuevo_valor}}
+
+# FUNCIÓN PARA MODIFICAR REGISTROS
+def modificar_interactivo(archivo, registros_por_pagina=20):
+    """
+    Función interactiva para modificar registros
+    Solo se muestran los primeros 'registros_por_pagina' registros; el elegido se lee
+    directo por su posición, sin recorrer el archivo
+    """
+    try:
+        if not os.path.exists(archivo):
+            print(f"Error: El archivo '{archivo}' no existe")
+            return False
+        
+        # Tabla de posiciones de cada registro (sin parsear el archivo)
+        total = len(tabla_offsets_csv(archivo)) - 1
+        
+        if total <= 0:
+            print("El archivo no contiene registros")
+            return False
+        
+        with open(archivo, 'r', encoding='utf-8', newline='') as file:
+            encabezados = csv.DictReader(file).fieldnames
+        
+        primera_pagina = obtener_registros_por_rango(archivo, 0, registros_por_pagina)
+        cambios = pedir_cambio_interactivo(archivo, primera_pagina, total,
+                                           lambda indice: obtener_registro_por_numero(archivo, indice),
+                                           encabezados)
+        if not cambios:
+            return False
+        
+        if modificar_registros(archivo, cambios):
+            print("Registro modificado exitosamente")
+            return True
+        return False
+    except Exception as e:
+        print(f"Error al modificar registros: {e}")
+        return False
+
+# FUNCIÓN PARA MODIFICAR VARIOS REGISTROS
+@instrumentar(bytes_archivo='reescritura')
+def modificar_registros(archivo, cambios):
+    """
+    Aplica muchas modificaciones a un CSV en una sola pasada, sin pedir datos por terminal
+    cambios: diccionario {indice: {campo: nuevo_valor}} con índices desde 0
+    Un único cambio se escribe directo sobre su registro; varios se aplican copiando
+    el archivo una vez a un temporal. Retorna la cantidad de registros modificados
+    """
+    archivo_temporal = None
+    try:
+        cambios = {int(indice): valores for indice, valores in cambios.items()}
+        if not cambios:
+            return 0
+        
+        # Se validan todos los índices antes de escribir, igual para uno o varios cambios
+        total = len(tabla_offsets_csv(archivo)) - 1
+        indices_invalidos = sorted(indice for indice in cambios if indice < 0 or indice >= total)
+        if indices_invalidos:
+            print(f"Índices inválidos: {indices_invalidos}. El archivo tiene {total} registros")
+            return 0
+        
+        if len(cambios) == 1:
+            indice, valores = next(iter(cambios.items()))
+            if not modificar_registro_por_numero(archivo, indice, valores):
+                return 0
+            print(f"Se modificaron 1 registros del archivo '{archivo}'")
+            return 1
+        
+        modificados = 0
+        directorio = os.path.dirname(os.path.abspath(archivo))
+        
+        with open(archivo, 'r', encoding='utf-8', newline='') as file:
+            reader = csv.DictReader(file)
+            encabezados = reader.fieldnames
+            
+            campos_invalidos = {campo for valores in cambios.values() for campo in valores} - set(encabezados)
+            if campos_invalidos:
+                print(f"Campos inválidos: {sorted(campos_invalidos)}")
+                return 0
+            
+            with tempfile.NamedTemporaryFile('w', newline='', encoding='utf-8', dir=directorio,
+                                             suffix='.tmp', delete=False) as temporal:
+                archivo_temporal = temporal.name
+                writer = csv.DictWriter(temporal, fieldnames=encabezados)
+                writer.writeheader()
+                
+                for i, registro in enumerate(reader):
+                    if i in cambios:
+                        registro.update(cambios[i])
+                        modificados += 1
+                    writer.writerow(registro)
+        
+        os.replace(archivo_temporal, archivo)
+        archivo_temporal = None
+        actualizar_indice(archivo)
+        
+        print(f"Se modificaron {modificados} registros del archivo '{archivo}'")
+        return modificados
+    except FileNotFoundError:
+        print(f"Error: El archivo '{archivo}' no existe.")
+        return 0
+    except Exception as e:
+        print(f"Error al modificar registros: {e}")
+        return 0
+    finally:
+        if archivo_temporal and os.path.exists(archivo_temporal):
+            os.remove(archivo_temporal)
+
+# FUNCIONES PARA ACCESO DIRECTO POR NÚMERO DE REGISTRO
+# La tabla de offsets guarda dónde empieza cada registro (y dónde termina el último),
+# así se puede ir directo al registro N sin recorrer los anteriores.
+_cache_offsets = {}
+
+@instrumentar(filas=lambda offsets: len(offsets) - 1, bytes_archivo='lectura')
+def tabla_offsets_csv(archivo):
+    """
+    Recorre el CSV con mmap en una sola pasada y retorna un array con el byte donde
+    empieza cada registro; el último elemento es el final del archivo.
+    La tabla se guarda en memoria mientras el archivo no cambie
+    """
+    firma = _firma_archivo(archivo)
+    en_cache = _cache_offsets.get(archivo)
+    if en_cache and en_cache[0] == firma:
+        return en_cache[1]
+    
+    offsets = array('q')
+    tamanio = firma[1]
+    if tamanio > 0:
+        with open(archivo, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            posicion = 0
+            primera = True
+            while posicion < tamanio:
+                inicio = posicion
+                fin = mm.find(b'\n', posicion)
+                # Si la línea tiene un campo entre comillas sin cerrar, el registro sigue en la próxima
+                while fin != -1 and mm.find(b'"', inicio, fin) != -1 and mm[inicio:fin].count(b'"') % 2 == 1:
+                    fin = mm.find(b'\n', fin + 1)
+                posicion = tamanio if fin == -1 else fin + 1
+                if primera:
+                    primera = False  # encabezado
+                elif posicion - inicio > len(b'\r\n') or mm[inicio:posicion].strip():
+                    offsets.append(inicio)
+    offsets.append(tamanio)
+    
+    _cache_offsets[archivo] = (firma, offsets)
+    return offsets
+
+def _leer_bytes(archivo, inicio, fin):
+    """
+    Lee el rango de bytes [inicio, fin) de un archivo
+    """
+    with open(archivo, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return mm[inicio:fin]
+
+@instrumentar()
+def obtener_registro_por_numero(archivo, numero):
+    """
+    Retorna el registro número 'numero' (desde 0) como diccionario, yendo directo a su posición.
+    Retorna None si el número está fuera de rango
+    """
+    try:
+        offsets = tabla_offsets_csv(archivo)
+        if numero < 0 or numero >= len(offsets) - 1:
+            return None
+        
+        with open(archivo, 'r', encoding='utf-8', newline='') as file:
+            encabezados = csv.DictReader(file).fieldnames
+        
+        linea = _leer_bytes(archivo, offsets[numero], offsets[numero + 1])
+        return dict(zip(encabezados, _parsear_linea(linea)))
+    except FileNotFoundError:
+        print(f"Error: El archivo '{archivo}' no existe.")
+        return None
+    except Exception as e:
+        print(f"Error al leer el registro: {e}")
+        return None
+
+@instrumentar()
+def obtener_registros_por_rango(archivo, inicio, fin):
+    """
+    Retorna los registros desde 'inicio' hasta 'fin' (sin incluirlo) leyendo solo
+    los bytes de ese rango del archivo
+    """
+    try:
+        offsets = tabla_offsets_csv(archivo)
+        total = len(offsets) - 1
+        inicio, fin = max(inicio, 0), min(fin, total)
+        if inicio >= fin:
+            return []
+        
+        with open(archivo, 'r', encoding='utf-8', newline='') as file:
+            encabezados = csv.DictReader(file).fieldnames
+        
+        bloque = _leer_bytes(archivo, offsets[inicio], offsets[fin]).decode('utf-8')
+        return list(csv.DictReader(io.StringIO(bloque, newline=''), fieldnames=encabezados))
+    except FileNotFoundError:
+        print(f"Error: El archivo '{archivo}' no existe.")
+        return []
+    except Exception as e:
+        print(f"Error al leer los registros: {e}")
+        return []
+
+@instrumentar()
+def modificar_registro_por_numero(archivo, numero, cambios):
+    """
+    Modifica los campos indicados en 'cambios' del registro número 'numero' (desde 0).
+    Solo se reescriben los bytes de ese registro: si el nuevo contenido ocupa lo mismo se
+    escribe en el lugar; si no, se copia el resto del archivo byte a byte sin parsearlo
+    """
+    try:
+        offsets = tabla_offsets_csv(archivo)
+        if numero < 0 or numero >= len(offsets) - 1:
+            print("Índice inválido")
+            return False
+        
+        with open(archivo, 'r', encoding='utf-8', newline='') as file:
+            encabezados = csv.DictReader(file).fieldnames
+        
+        campos_invalidos = [campo for campo in cambios if campo not in encabezados]
+        if campos_invalidos:
+            print(f"Campos inválidos: {campos_invalidos}")
+            return False
+        
+        inicio, fin = offsets[numero], offsets[numero + 1]
+        linea_anterior = _leer_bytes(archivo, inicio, fin)
+        registro = dict(zip(encabezados, _parsear_linea(linea_anterior)))
+        registro.update(cambios)
+        
+        # Mantener el mismo fin de línea que tenía el registro
+        if linea_anterior.endswith(b'\r\n'):
+            fin_linea = '\r\n'
+        elif linea_anterior.endswith(b'\n'):
+            fin_linea = '\n'
+        else:
+            fin_linea = ''
+        buffer = io.StringIO()
+        csv.DictWriter(buffer, fieldnames=encabezados, lineterminator=fin_linea or '\n').writerow(registro)
+        linea_nueva = buffer.getvalue()
+        if not fin_linea:
+            linea_nueva = linea_nueva[:-1]
+        linea_nueva = linea_nueva.encode('utf-8')
+        
+        indice = cargar_indice(archivo) if os.path.exists(ruta_indice(archivo)) else None
+        diferencia = len(linea_nueva) - len(linea_anterior)
+        
+        if diferencia == 0:
+            with open(archivo, 'r+b') as file:
+                file.seek(inicio)
+                file.write(linea_nueva)
+        else:
+            _reemplazar_rango(archivo, inicio, fin, linea_nueva)
+            for i in range(numero + 1, len(offsets)):
+                offsets[i] += diferencia
+        
+        _cache_offsets[archivo] = (_firma_archivo(archivo), offsets)
+        
+        if indice is not None:
+            _ajustar_indice(archivo, indice, inicio, diferencia,
+                            dict(zip(encabezados, _parsear_linea(linea_anterior))), registro)
+        return True
+    except FileNotFoundError:
+        print(f"Error: El archivo '{archivo}' no existe.")
+        return False
+    except Exception as e:
+        print(f"Error al modificar el registro: {e}")
+        return False
+
+def _reemplazar_rango(archivo, inicio, fin, contenido, tamanio_bloque=1024 * 1024):
+    """
+    Reemplaza los bytes [inicio, fin) del archivo por 'contenido' copiando el resto
+    a un archivo temporal en bloques, y luego reemplaza el original
+    """
+    directorio = os.path.dirname(os.path.abspath(archivo))
+    with open(archivo, 'rb') as origen, tempfile.NamedTemporaryFile('wb', dir=directorio, suffix='.tmp',
+                                                                    delete=False) as temporal:
+        try:
+            restante = inicio
+            while restante > 0:
+                bloque = origen.read(min(tamanio_bloque, restante))
+                if not bloque:
+                    break
+                temporal.write(bloque)
+                restante -= len(bloque)
+            temporal.write(contenido)
+            origen.seek(fin)
+            shutil.copyfileobj(origen, temporal, tamanio_bloque)
+        except Exception:
+            temporal.close()
+            os.remove(temporal.name)
+            raise
+    os.replace(temporal.name, archivo)
+
+def _ajustar_indice(archivo, indice, inicio, diferencia, registro_anterior, registro_nuevo):
+    """
+    Actualiza el índice de clave primaria después de modificar un registro en el lugar
+    """
+    campo_id = indice['campo_id']
+    id_anterior = str(registro_anterior.get(campo_id, ''))
+    id_nuevo = str(registro_nuevo.get(campo_id, ''))
+    
+    cambios = {id_anterior: None, id_nuevo: inicio} if id_nuevo != id_anterior else {}
+    
+    if not diferencia:
+        # Los demás registros no se movieron: alcanza con agregar el cambio de id al índice
+        _agregar_al_indice(archivo, indice, cambios)
+        return
+    for valor_id, offset in indice['offsets'].items():
+        if offset > inicio:
+            indice['offsets'][valor_id] = offset + diferencia
+    _aplicar_cambios(indice, cambios)
+    indice['mtime'], indice['tamanio'] = _firma_archivo(archivo)
+    guardar_indice(archivo, indice)
+
+# FUNCIONES PARA EL ÍNDICE DE CLAVE PRIMARIA
+# El índice se guarda junto al CSV en '<archivo>.idx' y contiene, para cada id,
+# el byte donde empieza su registro. Es un archivo JSON Lines: la primera línea tiene el campo
+# clave y los encabezados, la segunda todos los offsets y cada línea siguiente los ids
+# agregados o cambiados después (null = id que ya no existe), así agregar registros no reescribe
+# el índice completo. El id máximo asignado y la firma del CSV se guardan aparte en
+# '<archivo>.idx.estado', que es chico y se reescribe en cada cambio.
+# El índice leído queda en memoria mientras el CSV no cambie.
+_cache_indices = {}
+
+def ruta_indice(archivo):
+    """
+    Retorna la ruta del archivo de índice asociado a un CSV
+    """
+    return archivo + '.idx'
+
+def ruta_estado_indice(archivo):
+    """
+    Retorna la ruta del archivo con el id máximo y la firma del CSV del índice
+    """
+    return ruta_indice(archivo) + '.estado'
+
+def _registros_con_offset(file):
+    """
+    Recorre un CSV abierto en modo binario y devuelve (offset, línea) por registro,
+    uniendo las líneas de los campos entre comillas que contienen saltos de línea
+    """
+    while True:
+        offset = file.tell()
+        linea = file.readline()
+        if not linea:
+            return
+        while linea.count(b'"') % 2 == 1:
+            continuacion = file.readline()
+            if not continuacion:
+                break
+            linea += continuacion
+        yield offset, linea
+
+def _parsear_linea(linea):
+    """
+    Convierte una línea CSV (en bytes) en la lista de sus valores
+    """
+    return next(csv.reader([linea.decode('utf-8')]), [])
+
+def _firma_archivo(archivo):
+    """
+    Retorna la fecha de modificación y el tamaño del archivo, usados para detectar índices desactualizados
+    """
+    estado = os.stat(archivo)
+    return estado.st_mtime_ns, estado.st_size
+
+def _a_entero(valor):
+    """
+    Convierte un id a entero, o retorna None si no es numérico
+    """
+    try:
+        return int(valor)
+    except (TypeError, ValueError):
+        return None
+
+@instrumentar(filas=lambda indice: len(indice['offsets']), bytes_archivo='lectura')
+def construir_indice(archivo, campo_id=None, max_id_previo=0):
+    """
+    Recorre el CSV una vez y guarda el índice id -> offset en '<archivo>.idx'
+    campo_id: columna clave; por defecto la primera columna que empieza con 'id_'
+    """
+    offsets = {}
+    max_id = max_id_previo or 0
+    
+    with open(archivo, 'rb') as file:
+        registros = _registros_con_offset(file)
+        encabezado = next(registros, None)
+        encabezados = _parsear_linea(encabezado[1]) if encabezado else []
+        
+        if campo_id is None:
+            campo_id = next((campo for campo in encabezados if campo.lower().startswith('id_')),
+                            encabezados[0] if encabezados else None)
+        posicion = encabezados.index(campo_id) if campo_id in encabezados else None
+        
+        for offset, linea in registros:
+            valores = _parsear_linea(linea)
+            if posicion is None or posicion >= len(valores):
+                continue
+            valor_id = valores[posicion]
+            offsets[valor_id] = offset
+            numero = _a_entero(valor_id)
+            if numero is not None and numero > max_id:
+                max_id = numero
+    
+    mtime, tamanio = _firma_archivo(archivo)
+    indice = {
+        'campo_id': campo_id,
+        'encabezados': encabezados,
+        'mtime': mtime,
+        'tamanio': tamanio,
+        'max_id': max_id,
+        'offsets': offsets
+    }
+    guardar_indice(archivo, indice)
+    return indice
+
+def _guardar_estado(archivo, indice):
+    """
+    Escribe el id máximo y la firma del CSV a la que corresponde el índice
+    """
+    temporal = ruta_estado_indice(archivo) + '.tmp'
+    with open(temporal, 'w', encoding='utf-8') as file:
+        json.dump({'mtime': indice['mtime'], 'tamanio': indice['tamanio'], 'max_id': indice['max_id']}, file)
+    os.replace(temporal, ruta_estado_indice(archivo))
+
+def _aplicar_cambios(indice, cambios):
+    """
+    Aplica al índice en memoria los ids agregados o cambiados (offset None = id borrado)
+    """
+    for valor_id, offset in cambios.items():
+        if offset is None:
+            indice['offsets'].pop(valor_id, None)
+            continue
+        indice['offsets'][valor_id] = offset
+        numero = _a_entero(valor_id)
+        if numero is not None and numero > indice['max_id']:
+            indice['max_id'] = numero
+
+def guardar_indice(archivo, indice):
+    """
+    Escribe el índice completo en disco
+    """
+    with open(ruta_indice(archivo), 'w', encoding='utf-8') as file:
+        json.dump({'campo_id': indice['campo_id'], 'encabezados': indice['encabezados']}, file, ensure_ascii=False)
+        file.write('\n')
+        json.dump(indice['offsets'], file, ensure_ascii=False)
+        file.write('\n')
+    _guardar_estado(archivo, indice)
+    _cache_indices[archivo] = indice
+
+def _agregar_al_indice(archivo, indice, cambios):
+    """
+    Agrega al final del índice los ids nuevos o cambiados, sin reescribir el resto
+    """
+    if cambios:
+        with open(ruta_indice(archivo), 'a', encoding='utf-8') as file:
+            json.dump(cambios, file, ensure_ascii=False)
+            file.write('\n')
+        _aplicar_cambios(indice, cambios)
+    indice['mtime'], indice['tamanio'] = _firma_archivo(archivo)
+    _guardar_estado(archivo, indice)
+    _cache_indices[archivo] = indice
+
+def _leer_estado(archivo):
+    try:
+        with open(ruta_estado_indice(archivo), 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (FileNotFoundError, ValueError):
+        return None
+
+def _leer_indice(archivo, estado):
+    """
+    Lee el índice de disco aplicando las líneas agregadas; retorna None si no existe o está dañado
+    """
+    try:
+        with open(ruta_indice(archivo), 'r', encoding='utf-8') as file:
+            indice = json.loads(file.readline())
+            indice['offsets'] = json.loads(file.readline())
+            indice.update(estado)
+            for linea in file:
+                _aplicar_cambios(indice, json.loads(linea))
+        return indice
+    except (FileNotFoundError, ValueError, TypeError, AttributeError):
+        return None
+
+def cargar_indice(archivo, campo_id=None):
+    """
+    Retorna el índice del CSV: el que está en memoria o el de disco si corresponden al archivo actual;
+    si no existe o está desactualizado lo reconstruye
+    """
+    firma = _firma_archivo(archivo)
+    indice = _cache_indices.get(archivo)
+    if indice is not None and (indice['mtime'], indice['tamanio']) == firma and \
+            (campo_id is None or indice['campo_id'] == campo_id):
+        return indice
+    
+    estado = _leer_estado(archivo)
+    if estado is not None and (estado.get('mtime'), estado.get('tamanio')) == firma:
+        indice = _leer_indice(archivo, estado)
+        if indice is not None and (campo_id is None or indice.get('campo_id') == campo_id):
+            _cache_indices[archivo] = indice
+            return indice
+    
+    # Se conserva el id máximo anterior para no reutilizar ids de registros borrados
+    max_id_previo = estado.get('max_id', 0) if estado else 0
+    return construir_indice(archivo, campo_id, max_id_previo)
+
+def actualizar_indice(archivo):
+    """
+    Reconstruye el índice después de reescribir el CSV, solo si el archivo ya tenía índice
+    """
+    if not os.path.exists(ruta_indice(archivo)):
+        return
+    try:
+        with open(ruta_indice(archivo), 'r', encoding='utf-8') as file:
+            campo_id = json.loads(file.readline()).get('campo_id')
+        estado = _leer_estado(archivo) or {}
+        construir_indice(archivo, campo_id, estado.get('max_id', 0))
+    except Exception as e:
+        print(f"Aviso: no se pudo actualizar el índice de '{archivo}': {e}")
+
+def obtener_nuevo_id(archivo, campo_id=None):
+    """
+    Retorna el próximo id libre (máximo id asignado + 1) usando el índice
+    """
+    if not os.path.exists(archivo) or os.path.getsize(archivo) == 0:
+        return 1
+    return cargar_indice(archivo, campo_id)['max_id'] + 1
+
+@instrumentar()
+def buscar_por_id(archivo, valor_id, campo_id=None):
+    """
+    Busca un registro por su id saltando directamente a su posición en el archivo.
+    Retorna el registro como diccionario o None si no existe
+    """
+    try:
+        indice = cargar_indice(archivo, campo_id)
+        offset = indice['offsets'].get(str(valor_id))
+        if offset is None:
+            return None
+        
+        with open(archivo, 'rb') as file:
+            file.seek(offset)
+            _, linea = next(_registros_con_offset(file))
+        return dict(zip(indice['encabezados'], _parsear_linea(linea)))
+    except FileNotFoundError:
+        print(f"Error: El archivo '{archivo}' no existe.")
+        return None
+    except Exception as e:
+        print(f"Error al buscar el registro: {e}")
+        return None
+
+# FUNCIÓN PARA LEER JSON
+@instrumentar(bytes_archivo='lectura')
+def json_a_diccionarios(archivo):
+    """
+    Lee un archivo JSON y retorna una lista de diccionarios
+    """
+    try:
+        with open(archivo, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        print(f"Error: El archivo '{archivo}' no existe.")
+        return []
+    except Exception as e:
+        print(f"Error al leer el archivo JSON: {e}")
+        return []
+
+# FUNCIÓN PARA AGREGAR REGISTROS EN JSON
+@instrumentar(bytes_archivo='reescritura')
+def agregar_registro_json(archivo, nuevo_registro):
+    """
+    Agrega un nuevo registro al archivo JSON
+    """
+    try:
+        datos_existentes = json_a_diccionarios(archivo)
+        datos_existentes.append(nuevo_registro)
+        
+        with open(archivo, 'w', encoding='utf-8') as file:
+            json.dump(datos_existentes, file, indent=4, ensure_ascii=False)
+        
+        print(f"Registro agregado exitosamente al archivo '{archivo}': {nuevo_registro}")
+        return True
+    except Exception as e:
+        print(f"Error al agregar registro JSON: {e}")
+        return False
+
+# FUNCIÓN PARA AGREGAR VARIOS REGISTROS EN JSON
+@instrumentar(bytes_archivo='reescritura')
+def agregar_registros_json(archivo, registros):
+    """
+    Agrega muchos registros al archivo JSON leyéndolo y escribiéndolo una sola vez
+    Se agregan todos o ninguno: si el archivo no se puede leer o algún registro tiene
+    campos que no existen en los registros actuales, no se escribe nada.
+    Retorna la cantidad de registros agregados
+    """
+    try:
+        registros = list(registros)
+        datos_existentes = []
+        if os.path.exists(archivo):
+            # Se lee directo para no confundir un archivo dañado con uno vacío y pisarlo
+            with open(archivo, 'r', encoding='utf-8') as file:
+                datos_existentes = json.load(file)
+            if not isinstance(datos_existentes, list):
+                raise ValueError(f"el archivo '{archivo}' no contiene una lista de registros")
+        
+        campos = {campo for registro in datos_existentes for campo in registro}
+        if campos:
+            for numero, registro in enumerate(registros, start=1):
+                sobrantes = [campo for campo in registro if campo not in campos]
+                if sobrantes:
+                    print(f"Error: el registro {numero} tiene los campos {sobrantes} que no existen en '{archivo}'. "
+                          f"Campos válidos: {sorted(campos)}. No se agregó ninguno")
+                    return 0
+        
+        # Se arma el contenido completo antes de abrir el archivo para escritura
+        contenido = json.dumps(datos_existentes + registros, indent=4, ensure_ascii=False)
+        with open(archivo, 'w', encoding='utf-8') as file:
+            file.write(contenido)
+        
+        print(f"Se agregaron {len(registros)} registros al archivo '{archivo}'")
+        return len(registros)
+    except json.JSONDecodeError as e:
+        print(f"Error: el archivo '{archivo}' no es un JSON válido, no se agregó ningún registro: {e}")
+        return 0
+    except Exception as e:
+        print(f"Error al agregar registros JSON, no se agregó ninguno: {e}")
+        return 0
+
+# FUNCIÓN PARA BORRAR REGISTROS EN JSON
+@instrumentar(bytes_archivo='reescritura')
+def borrar_por_indice_json(archivo, indices):
+    """
+    Borra registros por sus índices en archivo JSON
+    """
+    try:
+        if not isinstance(indices, (list, set, tuple)):
+            indices = [indices]
+        indices = set(indices)
+        
+        datos = json_a_diccionarios(archivo)
+        registros_borrados = 0
+        
+        # Filtrar registros
+        datos_actualizados = [
+            registro for i, registro in enumerate(datos)
+            if i not in indices
+        ]
+        registros_borrados = len(datos) - len(datos_actualizados)
+        
+        with open(archivo, 'w', encoding='utf-8') as file:
+            json.dump(datos_actualizados, file, indent=4, ensure_ascii=False)
+        
+        print(f"Se borraron {registros_borrados} registros del archivo '{archivo}'")
+        return registros_borrados
+    except Exception as e:
+        print(f"Error al borrar registros JSON: {e}")
+        return 0
+
+# FUNCIÓN PARA MODIFICAR REGISTROS EN JSON
+def modificar_interactivo_json(archivo):
+    """
+    Función interactiva para modificar registros en JSON
+    """
+    try:
+        datos = json_a_diccionarios(archivo)
+        
+        if not datos:
+            print("El archivo no contiene registros")
+            return False
+        
+        cambios = pedir_cambio_interactivo(archivo, datos, len(datos), lambda indice: datos[indice])
+        if not cambios:
+            return False
+        
+        if modificar_registros_json(archivo, cambios):
+            print("Registro modificado exitosamente")
+            return True
+        return False
+    except Exception as e:
+        print(f"Error al modificar registros JSON: {e}")
+        return False
+
+# FUNCIÓN PARA MODIFICAR VARIOS REGISTROS EN JSON
+@instrumentar(bytes_archivo='reescritura')
+def modificar_registros_json(archivo, cambios):
+    """
+    Aplica muchas modificaciones a un archivo JSON leyéndolo y escribiéndolo una sola vez
+    cambios: diccionario {indice: {campo: nuevo_valor}} con índices desde 0
+    Retorna la cantidad de registros modificados
+    """
+    try:
+        datos = json_a_diccionarios(archivo)
+        modificados = 0
+        
+        for indice, valores in cambios.items():
+            indice = int(indice)
+            if 0 <= indice < len(datos):
+                datos[indice].update(valores)
+                modificados += 1
+            else:
+                print(f"Índice inválido: {indice}")
+        
+        if modificados:
+            with open(archivo, 'w', encoding='utf-8') as file:
+                json.dump(datos, file, indent=4, ensure_ascii=False)
+        
+        print(f"Se modificaron {modificados} registros del archivo '{archivo}'")
+        return modificados
+    except Exception as e:
+        print(f"Error al modificar registros JSON: {e}")
+        return 0
+
+# FUNCIÓN PARA RECORRER JSON LINES
+def iterar_jsonl(archivo, estricto=False):
+    """
+    Generador que devuelve los registros de un archivo JSON Lines (.jsonl),
+    un objeto JSON por línea
+    estricto: si es True los errores (por ejemplo una línea dañada o escrita a medias) se propagan
+    en lugar de cortar la lectura; se usa al reescribir el archivo para no perder los registros siguientes
+    """
+    try:
+        with open(archivo, 'r', encoding='utf-8') as file:
+            for numero, linea in enumerate(file, start=1):
+                linea = linea.strip()
+                if linea:
+                    try:
+                        registro = json.loads(linea)
+                    except ValueError as e:
+                        raise ValueError(f"la línea {numero} no es JSON válido: {e}") from e
+                    yield registro
+    except FileNotFoundError:
+        if estricto:
+            raise
+        print(f"Error: El archivo '{archivo}' no existe.")
+    except Exception as e:
+        if estricto:
+            raise
+        print(f"Error al leer el archivo JSON Lines: {e}")
+
+# FUNCIÓN PARA LEER JSON LINES
+@instrumentar(bytes_archivo='lectura')
+def jsonl_a_diccionarios(archivo):
+    """
+    Lee un archivo JSON Lines y retorna una lista de diccionarios
+    """
+    return list(iterar_jsonl(archivo))
+
+# FUNCIÓN PARA ESCRIBIR JSON LINES
+@instrumentar(filas=None, bytes_archivo='reescritura')
+def escribir_jsonl(archivo, registros):
+    """
+    Escribe los registros en un archivo temporal y luego reemplaza el original
+    """
+    directorio = os.path.dirname(os.path.abspath(archivo))
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directorio,
+                                     suffix='.tmp', delete=False) as temporal:
+        try:
+            for registro in registros:
+                temporal.write(json.dumps(registro, ensure_ascii=False) + '\n')
+        except Exception:
+            temporal.close()
+            os.remove(temporal.name)
+            raise
+    os.replace(temporal.name, archivo)
+
+# FUNCIÓN PARA AGREGAR REGISTROS EN JSON LINES
+@instrumentar(bytes_archivo='agregado')
+def agregar_registro_jsonl(archivo, nuevo_registro):
+    """
+    Agrega un nuevo registro al final del archivo JSON Lines sin reescribirlo
+    """
+    try:
+        with open(archivo, 'a', encoding='utf-8') as file:
+            file.write(json.dumps(nuevo_registro, ensure_ascii=False) + '\n')
+        
+        print(f"Registro agregado exitosamente al archivo '{archivo}': {nuevo_registro}")
+        return True
+    except Exception as e:
+        print(f"Error al agregar registro JSON Lines: {e}")
+        return False
+
+# FUNCIÓN PARA AGREGAR VARIOS REGISTROS EN JSON LINES
+@instrumentar(bytes_archivo='agregado')
+def agregar_registros_jsonl(archivo, registros):
+    """
+    Agrega muchos registros al final del archivo JSON Lines abriéndolo una sola vez
+    Retorna la cantidad de registros agregados
+    """
+    try:
+        agregados = 0
+        with open(archivo, 'a', encoding='utf-8') as file:
+            for registro in registros:
+                file.write(json.dumps(registro, ensure_ascii=False) + '\n')
+                agregados += 1
+        
+        print(f"Se agregaron {agregados} registros al archivo '{archivo}'")
+        return agregados
+    except Exception as e:
+        print(f"Error al agregar registros JSON Lines: {e}")
+        return 0
+
+# FUNCIÓN PARA BORRAR REGISTROS EN JSON LINES
+@instrumentar(bytes_archivo='reescritura')
+def borrar_por_indice_jsonl(archivo, indices):
+    """
+    Borra registros por sus índices en archivo JSON Lines
+    """
+    try:
+        if not os.path.exists(archivo):
+            print(f"Error: El archivo '{archivo}' no existe.")
+            return 0
+        
+        if not isinstance(indices, (list, set, tuple)):
+            indices = [indices]
+        indices = set(indices)
+        
+        borrados = 0
+        
+        def registros_restantes():
+            nonlocal borrados
+            for i, registro in enumerate(iterar_jsonl(archivo, estricto=True)):
+                if i in indices:
+                    borrados += 1
+                else:
+                    yield registro
+        
+        escribir_jsonl(archivo, registros_restantes())
+        
+        print(f"Se borraron {borrados} registros del archivo '{archivo}'")
+        return borrados
+    except Exception as e:
+        print(f"Error al borrar registros JSON Lines: {e}")
+        return 0
+
+# FUNCIÓN PARA MODIFICAR REGISTROS EN JSON LINES
+def modificar_interactivo_jsonl(archivo):
+    """
+    Función interactiva para modificar registros en JSON Lines
+    """
+    try:
+        datos = jsonl_a_diccionarios(archivo)
+        
+        if not datos:
+            print("El archivo no contiene registros")
+            return False
+        
+        cambios = pedir_cambio_interactivo(archivo, datos, len(datos), lambda indice: datos[indice])
+        if not cambios:
+            return False
+        
+        if modificar_registros_jsonl(archivo, cambios):
+            print("Registro modificado exitosamente")
+            return True
+        return False
+    except Exception as e:
+        print(f"Error al modificar registros JSON Lines: {e}")
+        return False
+
+# FUNCIÓN PARA MODIFICAR VARIOS REGISTROS EN JSON LINES
+@instrumentar(bytes_archivo='reescritura')
+def modificar_registros_jsonl(archivo, cambios):
+    """
+    Aplica muchas modificaciones a un archivo JSON Lines en una sola pasada
+    cambios: diccionario {indice: {campo: nuevo_valor}} con índices desde 0
+    Retorna la cantidad de registros modificados
+    """
+    try:
+        if not os.path.exists(archivo):
+            print(f"Error: El archivo '{archivo}' no existe.")
+            return 0
+        
+        cambios = {int(indice): valores for indice, valores in cambios.items()}
+        modificados = 0
+        
+        def registros_modificados():
+            nonlocal modificados
+            for i, registro in enumerate(iterar_jsonl(archivo, estricto=True)):
+                if i in cambios:
+                    registro.update(cambios[i])
+                    modificados += 1
+                yield registro
+        
+        escribir_jsonl(archivo, registros_modificados())
+        
+        print(f"Se modificaron {modificados} registros del archivo '{archivo}'")
+        return modificados
+    except Exception as e:
+        print(f"Error al modificar registros JSON Lines: {e}")
+        return 0
@@ -0,0 +1,256 @@
+# Instrumentación opcional de las operaciones de archivos y de análisis
+# Mide el tiempo, las filas procesadas y los bytes leídos/escritos de cada operación.
+# Está desactivada por defecto: se activa con la variable de entorno INSTRUMENTACION=1,
+# con activar() o desde el panel de depuración de las apps de Streamlit.
+# Con INSTRUMENTACION_LOG=<ruta> cada medición se agrega como una línea JSON en ese archivo.
+import os
+import sys
+import json
+import time
+import atexit
+import inspect
+import functools
+import threading
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+MAXIMO_REGISTROS = 1000  # mediciones que se guardan en memoria (las más recientes)
+COLUMNAS_RESUMEN = ['operacion', 'llamadas', 'segundos', 'promedio_ms', 'maximo_ms', 'filas', 'bytes_leidos', 'bytes_escritos', 'errores']
+
+_activa = False
+_ruta_log = None
+_registros = deque(maxlen=MAXIMO_REGISTROS)
+_resumen = {}
+_lock = threading.Lock()
+
+# ACTIVACIÓN
+def activar(ruta_log=None):
+    """
+    Activa la instrumentación; si se indica ruta_log las mediciones también se escriben en ese archivo (JSON Lines)
+    """
+    global _activa, _ruta_log
+    _activa = True
+    if ruta_log is not None:
+        _ruta_log = ruta_log
+
+def desactivar():
+    global _activa
+    _activa = False
+
+def esta_activa():
+    return _activa
+
+def limpiar():
+    """
+    Borra las mediciones y el resumen guardados en memoria (el archivo de log no se toca)
+    """
+    with _lock:
+        _registros.clear()
+        _resumen.clear()
+
+# MEDICIONES
+class Medicion:
+    """
+    Datos de una operación en curso; el código medido puede completar filas y bytes
+    """
+    def __init__(self, operacion, archivo=None):
+        self.operacion = operacion
+        self.archivo = archivo
+        self.filas = None
+        self.bytes_leidos = 0
+        self.bytes_escritos = 0
+
+def _registrar(medicion, segundos, error):
+    registro = {
+        'fecha': datetime.now().isoformat(timespec='milliseconds'),
+        'operacion': medicion.operacion,
+        'archivo': medicion.archivo,
+        'segundos': round(segundos, 6),
+        'filas': medicion.filas,
+        'bytes_leidos': medicion.bytes_leidos,
+        'bytes_escritos': medicion.bytes_escritos,
+        'error': error,
+    }
+    with _lock:
+        _registros.append(registro)
+        acumulado = _resumen.setdefault(medicion.operacion, {
+            'llamadas': 0, 'segundos': 0.0, 'maximo': 0.0, 'filas': 0,
+            'bytes_leidos': 0, 'bytes_escritos': 0, 'errores': 0})
+        acumulado['llamadas'] += 1
+        acumulado['segundos'] += segundos
+        acumulado['maximo'] = max(acumulado['maximo'], segundos)
+        acumulado['filas'] += medicion.filas or 0
+        acumulado['bytes_leidos'] += medicion.bytes_leidos
+        acumulado['bytes_escritos'] += medicion.bytes_escritos
+        acumulado['errores'] += error is not None
+        if _ruta_log:
+            try:
+                with open(_ruta_log, 'a', encoding='utf-8') as log:
+                    log.write(json.dumps(registro, ensure_ascii=False, default=str) + '\n')
+            except OSError as e:
+                print(f"Aviso: no se pudo escribir el log de instrumentación '{_ruta_log}': {e}")
+
+@contextmanager
+def medir(operacion, archivo=None):
+    """
+    Mide el bloque 'with'. Retorna la Medicion para que el bloque cargue filas y bytes:
+        with medir('leer_tabla', ruta) as m:
+            ...
+            m.filas = len(df)
+    Si la instrumentación está desactivada no registra nada
+    """
+    medicion = Medicion(operacion, archivo)
+    if not _activa:
+        yield medicion
+        return
+    inicio = time.perf_counter()
+    error = None
+    try:
+        yield medicion
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _registrar(medicion, time.perf_counter() - inicio, error)
+
+def contar_filas(resultado):
+    """
+    Filas procesadas según el resultado de la operación: largo de listas y tablas,
+    el número si retorna una cantidad (True cuenta como 1) y 1 si retorna un registro
+    """
+    if resultado is None:
+        return None
+    if isinstance(resultado, int):
+        return int(resultado)
+    if isinstance(resultado, dict):
+        return 1
+    try:
+        return len(resultado)
+    except TypeError:
+        return None
+
+def _tamanio(archivo):
+    try:
+        return os.path.getsize(archivo)
+    except (OSError, TypeError, ValueError):
+        return 0
+
+def instrumentar(operacion=None, filas=contar_filas, bytes_archivo=None, bytes_resultado=False):
+    """
+    Decorador que mide cada llamada de la función.
+    filas: función que recibe el resultado y retorna las filas procesadas
+    bytes_archivo: cómo estimar los bytes a partir del parámetro 'archivo' de la función
+        'lectura'     -> se lee el archivo completo
+        'agregado'    -> se escribe lo que crece el archivo
+        'reescritura' -> se lee el archivo original y se escribe el nuevo completo
+    bytes_resultado: la función retorna el contenido generado (bytes); se cuenta como escrito
+    """
+    def decorador(func):
+        nombre = operacion or func.__name__
+        firma = inspect.signature(func)
+
+        @functools.wraps(func)
+        def envoltura(*args, **kwargs):
+            if not _activa:
+                return func(*args, **kwargs)
+            archivo = None
+            if bytes_archivo or 'archivo' in firma.parameters:
+                try:
+                    archivo = firma.bind(*args, **kwargs).arguments.get('archivo')
+                except TypeError:
+                    pass
+            tamanio_antes = _tamanio(archivo) if bytes_archivo else 0
+            with medir(nombre, archivo if isinstance(archivo, (str, os.PathLike)) else None) as medicion:
+                resultado = func(*args, **kwargs)
+                medicion.filas = filas(resultado) if filas else None
+                if bytes_resultado and resultado is not None:
+                    medicion.bytes_escritos = len(resultado)
+                if bytes_archivo == 'lectura':
+                    medicion.bytes_leidos = tamanio_antes
+                elif bytes_archivo == 'agregado':
+                    medicion.bytes_escritos = max(_tamanio(archivo) - tamanio_antes, 0)
+                elif bytes_archivo == 'reescritura':
+                    medicion.bytes_leidos = tamanio_antes
+                    medicion.bytes_escritos = _tamanio(archivo)
+            return resultado
+        return envoltura
+    return decorador
+
+# CONSULTAS
+def registros(ultimos=None):
+    """
+    Retorna las mediciones guardadas en memoria (las 'ultimos' más recientes si se indica)
+    """
+    with _lock:
+        lista = list(_registros)
+    return lista[-ultimos:] if ultimos else lista
+
+def resumen():
+    """
+    Retorna una lista de diccionarios con el total por operación, ordenada por tiempo total
+    """
+    with _lock:
+        filas = [{
+            'operacion': operacion,
+            'llamadas': datos['llamadas'],
+            'segundos': round(datos['segundos'], 4),
+            'promedio_ms': round(datos['segundos'] / datos['llamadas'] * 1000, 3),
+            'maximo_ms': round(datos['maximo'] * 1000, 3),
+            'filas': datos['filas'],
+            'bytes_leidos': datos['bytes_leidos'],
+            'bytes_escritos': datos['bytes_escritos'],
+            'errores': datos['errores'],
+        } for operacion, datos in _resumen.items()]
+    return sorted(filas, key=lambda fila: fila['segundos'], reverse=True)
+
+def imprimir_resumen(archivo=None):
+    """
+    Imprime el resumen como tabla de texto
+    """
+    archivo = archivo or sys.stdout
+    filas = resumen()
+    if not filas:
+        print("Instrumentación: no hay mediciones registradas", file=archivo)
+        return
+    anchos = {columna: max(len(columna), *(len(f"{fila[columna]:,}" if columna != 'operacion' else fila[columna]) for fila in filas))
+              for columna in COLUMNAS_RESUMEN}
+    print(' | '.join(columna.ljust(anchos[columna]) for columna in COLUMNAS_RESUMEN), file=archivo)
+    print('-+-'.join('-' * anchos[columna] for columna in COLUMNAS_RESUMEN), file=archivo)
+    for fila in filas:
+        print(' | '.join(fila[columna].ljust(anchos[columna]) if columna == 'operacion'
+                         else f"{fila[columna]:,}".rjust(anchos[columna]) for columna in COLUMNAS_RESUMEN), file=archivo)
+
+# PANEL DE STREAMLIT
+def panel_depuracion(ultimos=50):
+    """
+    Dibuja en la barra lateral de Streamlit el panel para activar la instrumentación
+    y ver el resumen y las últimas mediciones. Las mediciones son del proceso: incluyen todas las sesiones
+    """
+    import streamlit as st
+
+    with st.sidebar.expander("🐞 Instrumentación", expanded=_activa):
+        if st.checkbox("Medir operaciones", value=_activa, key='instrumentacion_activa'):
+            activar()
+        else:
+            desactivar()
+        if not _activa:
+            st.caption("Activar para registrar tiempo, filas y bytes de cada operación")
+            return
+        filas = resumen()
+        if not filas:
+            st.caption("Todavía no hay mediciones")
+            return
+        st.dataframe(filas, hide_index=True)
+        st.caption(f"Últimas {min(ultimos, len(_registros))} mediciones")
+        st.dataframe(registros(ultimos)[::-1], hide_index=True)
+        if _ruta_log:
+            st.caption(f"Log: {_ruta_log}")
+        if st.button("Limpiar mediciones"):
+            limpiar()
+            st.rerun()
+
+# Activación por variable de entorno: en los scripts de consola el resumen se imprime al terminar
+if os.environ.get('INSTRUMENTACION', '').lower() in ('1', 'true', 'si', 'sí'):
+    activar(os.environ.get('INSTRUMENTACION_LOG'))
+    atexit.register(lambda: _registros and imprimir_resumen(sys.stderr))
\ No newline at end of file
@@ -1,171 +1,228 @@
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
-import numpy as np
-from sklearn.model_selection import train_test_split, GridSearchCV
-from sklearn.tree import DecisionTreeClassifier, plot_tree
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import classification_report, confusion_matrix, accuracy_score, precision_score, recall_score, f1_score
-from sklearn.preprocessing import StandardScaler
-from sklearn.utils import resample
-
-df = pd.read_excel("C:/Users/47-01/Downloads/Mini_Proyecto_Clientes_Promociones.xlsx")
-
-print("Columnas en el dataset:")
-print(df.columns.tolist())
-print("\nPrimeras filas del dataset:")
-print(df.head())
-print("\nInformación del dataset:")
-print(df.info())
-print("\nDistribución de la variable objetivo:")
-print(df['Recompra'].value_counts())
-
-# Preprocesamiento
-df['Genero'] = df['Genero'].map({'F':0,'M':1})
-df['Recibio_Promo'] = df['Recibio_Promo'].map({'Si':1, 'No':0})
-df['Recompra'] = df['Recompra'].map({'Si':1, 'No':0})
-
-# Verificar valores nulos
-print("\nValores nulos por columna:")
-print(df.isnull().sum())
-
-# Gráfico de barras
-plt.figure(figsize=(8, 6))
-sns.barplot(x="Recompra", y="Monto_Promo", data=df, estimator='mean', errorbar=None)
-plt.title("Promedio de Monto Promocional según Recompra")
-plt.xlabel("Recompra (0: No, 1: Si)")
-plt.ylabel("Monto Promocional Promedio")
-plt.show()
-
-# Preparación de datos
-X = df.drop(['Cliente_ID','Recompra'], axis=1)
-y = df['Recompra']
-
-# Identificar automáticamente las columnas numéricas (excluyendo las ya convertidas)
-numeric_cols = X.select_dtypes(include=[np.number]).columns.tolist()
-print(f"\nColumnas numéricas identificadas: {numeric_cols}")
-
-# Balanceo de clases (si es necesario)
-print(f"\nDistribución original de clases: {y.value_counts().to_dict()}")
-
-# Si hay desbalance significativo, aplicar balanceo
-if len(y.value_counts()) > 1 and y.value_counts().min() / y.value_counts().max() < 0.5:
-    print("Aplicando balanceo de clases...")
-    # Unir X e y para el balanceo
-    df_balanced = pd.concat([X, y], axis=1)
-    
-    # Separar clases
-    df_majority = df_balanced[df_balanced.Recompra == 0]
-    df_minority = df_balanced[df_balanced.Recompra == 1]
-    
-    # Balancear por oversampling de la clase minoritaria
-    df_minority_upsampled = resample(df_minority, 
-                                     replace=True, 
-                                     n_samples=len(df_majority), 
-                                     random_state=42)
-    
-    # Combinar las clases balanceadas
-    df_balanced = pd.concat([df_majority, df_minority_upsampled])
-    
-    # Separar nuevamente X e y
-    X = df_balanced.drop('Recompra', axis=1)
-    y = df_balanced['Recompra']
-    print(f"Distribución después del balanceo: {y.value_counts().to_dict()}")
-
-# Escalar características numéricas si existen
-if numeric_cols:
-    scaler = StandardScaler()
-    X[numeric_cols] = scaler.fit_transform(X[numeric_cols])
-    print("Características numéricas escaladas.")
-else:
-    print("No hay características numéricas para escalar.")
-
-# División de datos
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
-
-# MEJORA 1: Optimización de hiperparámetros con GridSearchCV
-print("\nOptimizando hiperparámetros...")
-param_grid = {
-    'max_depth': [3, 5, 7, 10, 15, None],
-    'min_samples_split': [2, 5, 10],
-    'min_samples_leaf': [1, 2, 4],
-    'criterion': ['gini', 'entropy']
-}
-
-grid_search = GridSearchCV(DecisionTreeClassifier(random_state=42), 
-                          param_grid, 
-                          cv=5, 
-                          scoring='accuracy',
-                          n_jobs=-1)
-grid_search.fit(X_train, y_train)
-
-print(f"Mejores parámetros: {grid_search.best_params_}")
-print(f"Mejor score en validación: {grid_search.best_score_:.4f}")
-
-# MEJORA 2: Usar el modelo optimizado
-best_model = grid_search.best_estimator_
-
-# MEJORA 3: Probar con Random Forest (generalmente mejor que un solo árbol)
-rf_model = RandomForestClassifier(n_estimators=100, random_state=42)
-rf_model.fit(X_train, y_train)
-
-# Evaluación de modelos
-models = {
-    'Árbol de Decisión Optimizado': best_model,
-    'Random Forest': rf_model
-}
-
-for name, model in models.items():
-    y_pred = model.predict(X_test)
-    
-    print(f"\n=== {name} ===")
-    print(f"Exactitud: {accuracy_score(y_test, y_pred):.4f}")
-    print(f"Precisión: {precision_score(y_test, y_pred):.4f}")
-    print(f"Recall: {recall_score(y_test, y_pred):.4f}")
-    print(f"F1-Score: {f1_score(y_test, y_pred):.4f}")
-    
-    # Matriz de confusión
-    plt.figure(figsize=(6, 5))
-    cm = confusion_matrix(y_test, y_pred)
-    sns.heatmap(cm, 
-                annot=True, 
-                fmt='d', 
-                cmap='Blues',
-                xticklabels=['No Recompra', 'Si Recompra'],
-                yticklabels=['No Recompra', 'Si Recompra'])
-    plt.title(f'Matriz de Confusión - {name}')
-    plt.xlabel('Predicción')
-    plt.ylabel('Real')
-    plt.show()
-
-# Gráfico del árbol de decisión optimizado (solo si no es demasiado grande)
-if grid_search.best_params_['max_depth'] is not None and grid_search.best_params_['max_depth'] <= 10:
-    plt.figure(figsize=(20, 10))
-    plot_tree(best_model, 
-              feature_names=X.columns,
-              class_names=['No Recompra', 'Si Recompra'],
-              filled=True,
-              rounded=True,
-              fontsize=10)
-    plt.title("Árbol de Decisión Optimizado")
-    plt.show()
-else:
-    print("El árbol es demasiado grande para visualizar de manera clara.")
-
-# Importancia de características (para Random Forest)
-plt.figure(figsize=(10, 6))
-importances = rf_model.feature_importances_
-feature_names = X.columns
-indices = np.argsort(importances)[::-1]
-
-plt.barh(range(len(importances)), importances[indices])
-plt.yticks(range(len(importances)), [feature_names[i] for i in indices])
-plt.xlabel('Importancia')
-plt.title('Importancia de Características - Random Forest')
-plt.gca().invert_yaxis()
-plt.show()
-
-# Reporte detallado del mejor modelo
-print("\n=== REPORTE DETALLADO DEL MEJOR MODELO ===")
-y_pred_best = best_model.predict(X_test)
-print(classification_report(y_test, y_pred_best))
\ No newline at end of file
+import time
+import argparse
+import pandas as pd
+import seaborn as sns
+import matplotlib.pyplot as plt
+import numpy as np
+from joblib import Memory
+from scipy.stats import randint
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import (train_test_split, GridSearchCV, RandomizedSearchCV,
+                                     HalvingGridSearchCV, HalvingRandomSearchCV)
+from sklearn.tree import DecisionTreeClassifier, plot_tree
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import classification_report, confusion_matrix, accuracy_score, precision_score, recall_score, f1_score
+from sklearn.pipeline import Pipeline
+from modelo_recompra import PreprocesadorGimnasio, codificar_objetivo, balancear, guardar_pipeline, ARCHIVO_MODELO
+
+# Opciones de la búsqueda de hiperparámetros
+parser = argparse.ArgumentParser(description="Árbol de decisión y Random Forest para predecir la recompra")
+parser.add_argument('--datos', default="C:/Users/47-01/Downloads/Mini_Proyecto_Clientes_Promociones.xlsx")
+parser.add_argument('--busqueda', choices=['grilla', 'aleatoria', 'halving', 'halving-aleatoria'], default='grilla',
+                    help="grilla: todas las combinaciones; aleatoria: muestra de combinaciones; "
+                         "halving: descarta en cada ronda los peores candidatos entrenando con más datos a los que quedan")
+parser.add_argument('--iteraciones', type=int, default=30, help="Candidatos de la búsqueda aleatoria")
+parser.add_argument('--n-jobs', type=int, default=-1, help="Procesos para la búsqueda y el Random Forest (-1: todos los núcleos)")
+parser.add_argument('--cache', default='.cache_busqueda', help="Directorio donde se guardan los entrenamientos de cada fold")
+parser.add_argument('--sin-cache', action='store_true', help="No usar ni guardar entrenamientos en disco")
+args = parser.parse_args()
+
+# Caché de entrenamientos por fold: cada árbol entrenado se guarda con sus parámetros y los datos del fold,
+# así al agrandar la grilla o repetir la corrida solo se entrenan los candidatos nuevos
+memoria = None if args.sin_cache else Memory(args.cache, verbose=0)
+
+def entrenar_arbol(parametros, X, y):
+    return DecisionTreeClassifier(**parametros).fit(X, y)
+
+class ArbolConCache(DecisionTreeClassifier):
+    """Árbol de decisión que reutiliza el entrenamiento guardado si ya se entrenó con los mismos parámetros y datos"""
+    def fit(self, X, y, sample_weight=None, check_input=True):
+        if memoria is None or sample_weight is not None:
+            return super().fit(X, y, sample_weight=sample_weight, check_input=check_input)
+        arbol = memoria.cache(entrenar_arbol)(self.get_params(), X, y)
+        self.__dict__.update(arbol.__dict__)
+        return self
+
+df = pd.read_excel(args.datos)
+
+print("Columnas en el dataset:")
+print(df.columns.tolist())
+print("\nPrimeras filas del dataset:")
+print(df.head())
+print("\nInformación del dataset:")
+print(df.info())
+print("\nDistribución de la variable objetivo:")
+print(df['Recompra'].value_counts())
+
+# Preprocesamiento: la variable objetivo se codifica acá; Genero, Recibio_Promo y el escalado
+# los hace el preprocesador, que se guarda junto con el modelo
+df['Recompra'] = codificar_objetivo(df['Recompra'])
+
+# Verificar valores nulos
+print("\nValores nulos por columna:")
+print(df.isnull().sum())
+
+# Gráfico de barras
+plt.figure(figsize=(8, 6))
+sns.barplot(x="Recompra", y="Monto_Promo", data=df, estimator='mean', errorbar=None)
+plt.title("Promedio de Monto Promocional según Recompra")
+plt.xlabel("Recompra (0: No, 1: Si)")
+plt.ylabel("Monto Promocional Promedio")
+plt.show()
+
+# Preparación de datos
+X = df.drop(['Cliente_ID','Recompra'], axis=1)
+y = df['Recompra']
+
+# División de datos (antes del balanceo, así el conjunto de prueba no tiene copias de casos de entrenamiento)
+X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
+
+# Balanceo de clases (si es necesario), solo sobre los datos de entrenamiento
+print(f"\nDistribución original de clases: {y_train.value_counts().to_dict()}")
+X_train, y_train, balanceado = balancear(X_train, y_train)
+if balanceado:
+    print("Aplicando balanceo de clases...")
+    print(f"Distribución después del balanceo: {y_train.value_counts().to_dict()}")
+
+# Codificación y escalado aprendidos con los datos de entrenamiento
+preprocesador = PreprocesadorGimnasio(escalar=True).fit(X_train)
+print(f"\nColumnas numéricas identificadas: {preprocesador.columnas_numericas_}")
+if preprocesador.columnas_numericas_:
+    print("Características numéricas escaladas.")
+else:
+    print("No hay características numéricas para escalar.")
+X_test_original = X_test
+X_train = preprocesador.transform(X_train)
+X_test = preprocesador.transform(X_test)
+
+# MEJORA 1: Optimización de hiperparámetros (grilla, aleatoria o successive halving)
+print(f"\nOptimizando hiperparámetros (búsqueda: {args.busqueda})...")
+param_grid = {
+    'max_depth': [3, 5, 7, 10, 15, None],
+    'min_samples_split': [2, 5, 10],
+    'min_samples_leaf': [1, 2, 4],
+    'criterion': ['gini', 'entropy']
+}
+param_distributions = {
+    'max_depth': [3, 4, 5, 6, 7, 8, 10, 12, 15, 20, None],
+    'min_samples_split': randint(2, 21),
+    'min_samples_leaf': randint(1, 11),
+    'criterion': ['gini', 'entropy']
+}
+
+opciones_busqueda = {'cv': 5, 'scoring': 'accuracy', 'n_jobs': args.n_jobs}
+# Successive halving empieza con cv * clases * 2 filas por candidato y necesita al menos
+# dos rondas (factor 3); con menos filas se usa la búsqueda completa equivalente
+FACTOR_HALVING = 3
+minimo_halving = opciones_busqueda['cv'] * y_train.nunique() * 2
+if args.busqueda.startswith('halving') and len(X_train) < minimo_halving * FACTOR_HALVING:
+    alternativa = 'grilla' if args.busqueda == 'halving' else 'aleatoria'
+    print(f"Aviso: {len(X_train)} filas de entrenamiento no alcanzan para successive halving "
+          f"(necesita al menos {minimo_halving * FACTOR_HALVING}); se usa la búsqueda '{alternativa}'")
+    args.busqueda = alternativa
+
+if args.busqueda == 'grilla':
+    grid_search = GridSearchCV(ArbolConCache(random_state=42), param_grid, **opciones_busqueda)
+elif args.busqueda == 'aleatoria':
+    grid_search = RandomizedSearchCV(ArbolConCache(random_state=42), param_distributions,
+                                     n_iter=args.iteraciones, random_state=42, **opciones_busqueda)
+elif args.busqueda == 'halving':
+    grid_search = HalvingGridSearchCV(ArbolConCache(random_state=42), param_grid,
+                                      factor=FACTOR_HALVING, random_state=42, **opciones_busqueda)
+else:
+    grid_search = HalvingRandomSearchCV(ArbolConCache(random_state=42), param_distributions,
+                                        n_candidates=args.iteraciones, factor=FACTOR_HALVING, random_state=42, **opciones_busqueda)
+
+inicio = time.perf_counter()
+grid_search.fit(X_train, y_train)
+print(f"Búsqueda terminada en {time.perf_counter() - inicio:.2f}s")
+
+# Tiempo de cada candidato: entrenamiento y evaluación de todos sus folds
+resultados = pd.DataFrame(grid_search.cv_results_)
+n_folds = grid_search.n_splits_
+resultados['tiempo_total_s'] = (resultados['mean_fit_time'] + resultados['mean_score_time']) * n_folds
+columnas_reporte = ['params', 'mean_test_score', 'rank_test_score', 'tiempo_total_s']
+if 'iter' in resultados.columns:
+    columnas_reporte = ['iter', 'n_resources'] + columnas_reporte
+resultados = resultados.sort_values(['rank_test_score', 'tiempo_total_s'])[columnas_reporte]
+resultados.to_csv('resultados_busqueda.csv', index=False)
+print(f"\nCandidatos evaluados: {len(resultados)} (tabla completa en resultados_busqueda.csv)")
+print(resultados.head(15).to_string(index=False))
+
+print(f"Mejores parámetros: {grid_search.best_params_}")
+print(f"Mejor score en validación: {grid_search.best_score_:.4f}")
+
+# MEJORA 2: Usar el modelo optimizado (como DecisionTreeClassifier común, para poder guardarlo con su preprocesamiento)
+best_model = DecisionTreeClassifier(**grid_search.best_estimator_.get_params()).fit(X_train, y_train)
+
+# MEJORA 3: Probar con Random Forest (generalmente mejor que un solo árbol)
+rf_model = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=args.n_jobs)
+rf_model.fit(X_train, y_train)
+
+# Evaluación de modelos
+models = {
+    'Árbol de Decisión Optimizado': best_model,
+    'Random Forest': rf_model
+}
+
+for name, model in models.items():
+    y_pred = model.predict(X_test)
+    
+    print(f"\n=== {name} ===")
+    print(f"Exactitud: {accuracy_score(y_test, y_pred):.4f}")
+    print(f"Precisión: {precision_score(y_test, y_pred):.4f}")
+    print(f"Recall: {recall_score(y_test, y_pred):.4f}")
+    print(f"F1-Score: {f1_score(y_test, y_pred):.4f}")
+    
+    # Matriz de confusión
+    plt.figure(figsize=(6, 5))
+    cm = confusion_matrix(y_test, y_pred)
+    sns.heatmap(cm, 
+                annot=True, 
+                fmt='d', 
+                cmap='Blues',
+                xticklabels=['No Recompra', 'Si Recompra'],
+                yticklabels=['No Recompra', 'Si Recompra'])
+    plt.title(f'Matriz de Confusión - {name}')
+    plt.xlabel('Predicción')
+    plt.ylabel('Real')
+    plt.show()
+
+# Gráfico del árbol de decisión optimizado (solo si no es demasiado grande)
+if grid_search.best_params_['max_depth'] is not None and grid_search.best_params_['max_depth'] <= 10:
+    plt.figure(figsize=(20, 10))
+    plot_tree(best_model, 
+              feature_names=preprocesador.columnas_,
+              class_names=['No Recompra', 'Si Recompra'],
+              filled=True,
+              rounded=True,
+              fontsize=10)
+    plt.title("Árbol de Decisión Optimizado")
+    plt.show()
+else:
+    print("El árbol es demasiado grande para visualizar de manera clara.")
+
+# Importancia de características (para Random Forest)
+plt.figure(figsize=(10, 6))
+importances = rf_model.feature_importances_
+feature_names = preprocesador.columnas_
+indices = np.argsort(importances)[::-1]
+
+plt.barh(range(len(importances)), importances[indices])
+plt.yticks(range(len(importances)), [feature_names[i] for i in indices])
+plt.xlabel('Importancia')
+plt.title('Importancia de Características - Random Forest')
+plt.gca().invert_yaxis()
+plt.show()
+
+# Reporte detallado del mejor modelo
+print("\n=== REPORTE DETALLADO DEL MEJOR MODELO ===")
+y_pred_best = best_model.predict(X_test)
+print(classification_report(y_test, y_pred_best))
+
+# Guardar el mejor árbol junto con su preprocesamiento: para predecir clientes nuevos
+# alcanza con cargar el archivo y llamar a predict con los datos originales
+pipeline = Pipeline([('preprocesamiento', preprocesador), ('modelo', best_model)])
+guardar_pipeline(pipeline, ARCHIVO_MODELO)
+coinciden = (pipeline.predict(X_test_original) == y_pred_best).all()
+print(f"\nModelo guardado en {ARCHIVO_MODELO} (predicciones del pipeline sobre los datos originales {'coinciden' if coinciden else 'NO coinciden'})")
@@ -0,0 +1,123 @@
+# Cadena de Gimnasio - Preprocesamiento y modelo de recompra
+# El preprocesamiento (codificación de categorías, selección de columnas y escalado opcional)
+# es un transformador de scikit-learn que se entrena y se guarda junto con el modelo en un Pipeline.
+# Así, predecir sobre clientes nuevos es una sola llamada a predict con los datos tal como vienen
+# del Excel, y el entrenamiento y la predicción usan siempre la misma transformación.
+import os
+import argparse
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.utils import resample
+
+ARCHIVO_MODELO = 'modelo_recompra.joblib'
+OBJETIVO = 'Recompra'
+COLUMNAS_EXCLUIDAS = ['Cliente_ID', OBJETIVO]
+MAPEOS = {
+    'Genero': {'F': 0, 'M': 1},
+    'Recibio_Promo': {'Si': 1, 'No': 0},
+}
+MAPEO_OBJETIVO = {'Si': 1, 'No': 0}
+
+def codificar_objetivo(y):
+    """
+    Convierte la columna Recompra (Si/No) en 1/0
+    """
+    return y if pd.api.types.is_numeric_dtype(y) else y.map(MAPEO_OBJETIVO)
+
+class PreprocesadorGimnasio(BaseEstimator, TransformerMixin):
+    """
+    Codifica Genero y Recibio_Promo, descarta Cliente_ID y Recompra, ordena las columnas
+    como en el entrenamiento y, si escalar=True, estandariza las columnas numéricas
+    con la media y el desvío aprendidos en fit
+    """
+    def __init__(self, escalar=False):
+        self.escalar = escalar
+
+    def _codificar(self, X):
+        X = X.drop(columns=[col for col in COLUMNAS_EXCLUIDAS if col in X.columns])
+        for col, mapeo in MAPEOS.items():
+            if col in X.columns and not pd.api.types.is_numeric_dtype(X[col]):
+                X[col] = X[col].map(mapeo)
+        return X
+
+    def fit(self, X, y=None):
+        X = self._codificar(X)
+        self.columnas_ = X.columns.tolist()
+        self.columnas_numericas_ = X.select_dtypes(include=[np.number]).columns.tolist()
+        if self.escalar and self.columnas_numericas_:
+            self.escalador_ = StandardScaler().fit(X[self.columnas_numericas_])
+        return self
+
+    def transform(self, X):
+        X = self._codificar(X)
+        faltantes = [col for col in self.columnas_ if col not in X.columns]
+        if faltantes:
+            raise ValueError(f"Faltan columnas para predecir: {faltantes}")
+        X = X[self.columnas_]
+        if self.escalar and self.columnas_numericas_:
+            X[self.columnas_numericas_] = self.escalador_.transform(X[self.columnas_numericas_])
+        return X
+
+    def get_feature_names_out(self, input_features=None):
+        return np.array(self.columnas_, dtype=object)
+
+def crear_pipeline(modelo, escalar=False):
+    """
+    Retorna el Pipeline preprocesamiento + modelo, sin entrenar
+    """
+    return Pipeline([('preprocesamiento', PreprocesadorGimnasio(escalar=escalar)), ('modelo', modelo)])
+
+def balancear(X, y, proporcion_minima=0.5, random_state=42):
+    """
+    Si la clase minoritaria tiene menos de proporcion_minima de los casos de la mayoritaria,
+    la sobremuestrea hasta igualarla. Se usa solo con los datos de entrenamiento.
+    Retorna (X, y, si se aplicó el balanceo)
+    """
+    conteo = y.value_counts()
+    if len(conteo) < 2 or conteo.min() / conteo.max() >= proporcion_minima:
+        return X, y, False
+    mayoritaria = y == conteo.idxmax()
+    indices_minoritaria = resample(y.index[~mayoritaria], replace=True,
+                                   n_samples=int(mayoritaria.sum()), random_state=random_state)
+    indices = y.index[mayoritaria].append(pd.Index(indices_minoritaria))
+    return X.loc[indices], y.loc[indices], True
+
+def guardar_pipeline(pipeline, ruta=ARCHIVO_MODELO):
+    """
+    Guarda el Pipeline entrenado (preprocesamiento + modelo) en un solo archivo
+    """
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    joblib.dump(pipeline, temporal)
+    os.replace(temporal, ruta)
+
+def cargar_pipeline(ruta=ARCHIVO_MODELO):
+    return joblib.load(ruta)
+
+def predecir_recompra(pipeline, clientes):
+    """
+    Retorna los clientes con la predicción y la probabilidad de recompra
+    """
+    probabilidades = pipeline.predict_proba(clientes)
+    clases = pipeline.classes_
+    resultado = clientes.copy()
+    resultado['Prediccion_Recompra'] = clases[probabilidades.argmax(axis=1)]
+    resultado['Probabilidad_Recompra'] = probabilidades[:, list(clases).index(1)]
+    return resultado
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Predice la recompra de clientes nuevos con el modelo guardado")
+    parser.add_argument('datos', help="Excel o CSV con los clientes")
+    parser.add_argument('--modelo', default=ARCHIVO_MODELO)
+    parser.add_argument('--salida', default='predicciones_recompra.csv')
+    args = parser.parse_args()
+
+    pipeline = cargar_pipeline(args.modelo)
+    clientes = pd.read_csv(args.datos) if args.datos.endswith('.csv') else pd.read_excel(args.datos)
+    resultado = predecir_recompra(pipeline, clientes)
+    resultado.to_csv(args.salida, index=False)
+    print(f"{len(resultado)} clientes evaluados, {int(resultado['Prediccion_Recompra'].sum())} con recompra predicha")
+    print(f"Resultados guardados en {args.salida}")
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""Predicción de abandono por lotes, sin cargar el archivo completo en memoria.
+
+El archivo se lee por bloques, cada bloque se codifica con tablas de búsqueda armadas
+una sola vez a partir de los LabelEncoder del modelo, se predice con una única llamada
+a predict_proba y los resultados se van escribiendo en el CSV de salida.
+"""
+import csv
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+TAMANIO_BLOQUE = 50_000
+UMBRAL_RIESGO_ALTO = 0.7
+UMBRAL_RIESGO_MODERADO = 0.3
+ESTADOS = np.array(['Continúa', 'Abandona'])
+
+def preparar_codificacion(label_encoders):
+    """Arma una tabla de búsqueda (valor -> código) por cada columna categórica"""
+    return {col: pd.Index(le.classes_) for col, le in label_encoders.items()}
+
+def leer_por_bloques(archivo, nombre, tamanio_bloque=TAMANIO_BLOQUE):
+    """Generador de DataFrames de hasta tamanio_bloque filas de un archivo CSV o Excel"""
+    if nombre.endswith('.csv'):
+        yield from pd.read_csv(archivo, chunksize=tamanio_bloque)
+    elif nombre.endswith('.xlsx'):
+        libro = load_workbook(archivo, read_only=True, data_only=True)
+        try:
+            filas = libro.active.iter_rows(values_only=True)
+            encabezados = next(filas, None)
+            if encabezados is None:
+                return
+            bloque = []
+            for fila in filas:
+                bloque.append(fila)
+                if len(bloque) >= tamanio_bloque:
+                    yield pd.DataFrame(bloque, columns=encabezados)
+                    bloque = []
+            if bloque:
+                yield pd.DataFrame(bloque, columns=encabezados)
+        finally:
+            libro.close()
+    else:
+        raise ValueError("Formato de archivo no soportado. Use .xlsx o .csv")
+
+def codificar_bloque(bloque, codificacion, feature_columns):
+    """Retorna la matriz de características del bloque con las categorías ya codificadas.
+    Los valores que el encoder no conoce y las columnas que faltan se codifican como 0"""
+    columnas = {}
+    for col in feature_columns:
+        if col not in bloque.columns:
+            columnas[col] = np.zeros(len(bloque), dtype=np.int64)
+        elif col in codificacion:
+            codigos = codificacion[col].get_indexer(bloque[col].astype(str))
+            columnas[col] = np.where(codigos < 0, 0, codigos)
+        else:
+            columnas[col] = bloque[col].to_numpy()
+    return pd.DataFrame(columnas, index=bloque.index)
+
+def predecir_bloque(modelo, bloque, codificacion, feature_columns):
+    """Agrega al bloque la predicción, la probabilidad de abandono, el estado y el nivel de riesgo"""
+    probabilidades = modelo.predict_proba(codificar_bloque(bloque, codificacion, feature_columns))
+    prediccion = modelo.classes_[probabilidades.argmax(axis=1)]
+    probabilidad = probabilidades[:, list(modelo.classes_).index(1)]
+    resultado = bloque.copy()
+    resultado['Prediccion_Abandono'] = prediccion
+    resultado['Probabilidad_Abandono'] = probabilidad
+    resultado['Estado_Predicho'] = ESTADOS[prediccion]
+    resultado['Riesgo'] = np.select(
+        [probabilidad > UMBRAL_RIESGO_ALTO, probabilidad > UMBRAL_RIESGO_MODERADO],
+        ['ALTO', 'MODERADO'], default='BAJO')
+    return resultado
+
+def predecir_lote(modelo, label_encoders, feature_columns, archivo, nombre, salida,
+                  tamanio_bloque=TAMANIO_BLOQUE, filas_vista_previa=1000):
+    """Predice todo el archivo por bloques y escribe los resultados en el CSV 'salida'.
+    Retorna un resumen con el total evaluado, la cantidad por estado y las primeras filas"""
+    codificacion = preparar_codificacion(label_encoders)
+    total = 0
+    por_estado = pd.Series(0, index=ESTADOS)
+    por_riesgo = pd.Series(0, index=['ALTO', 'MODERADO', 'BAJO'])
+    vista_previa = []
+    with open(salida, 'w', newline='', encoding='utf-8') as file:
+        for numero, bloque in enumerate(leer_por_bloques(archivo, nombre, tamanio_bloque)):
+            resultado = predecir_bloque(modelo, bloque, codificacion, feature_columns)
+            resultado.to_csv(file, index=False, header=numero == 0, quoting=csv.QUOTE_MINIMAL)
+            total += len(resultado)
+            por_estado = por_estado.add(resultado['Estado_Predicho'].value_counts(), fill_value=0)
+            por_riesgo = por_riesgo.add(resultado['Riesgo'].value_counts(), fill_value=0)
+            faltan = filas_vista_previa - sum(len(parte) for parte in vista_previa)
+            if faltan > 0:
+                vista_previa.append(resultado.head(faltan))
+    return {
+        'total': total,
+        'por_estado': por_estado.astype(int),
+        'por_riesgo': por_riesgo.astype(int),
+        'vista_previa': pd.concat(vista_previa) if vista_previa else pd.DataFrame(),
+    }
\ No newline at end of file
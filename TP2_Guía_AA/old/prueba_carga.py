@@ -0,0 +1,124 @@
+"""Prueba de carga del servicio de predicción (servicio_prediccion.py) en localhost.
+
+Varios clientes concurrentes envían pedidos de un estudiante a POST /predecir, cada uno por
+su propia conexión persistente. Al final se muestran la latencia vista por los clientes,
+los pedidos por segundo y las estadísticas del servicio (incluido el tamaño promedio de los lotes).
+
+Uso:
+    python servicio_prediccion.py &
+    python prueba_carga.py --clientes 16 --pedidos 500
+    python prueba_carga.py --datos alumnos.csv     # estudiantes tomados de un archivo en lugar de aleatorios
+"""
+import json
+import time
+import random
+import argparse
+import threading
+import http.client
+import numpy as np
+import pandas as pd
+
+CARRERAS = [
+    "Tecnicatura Superior en Análisis de Sistemas",
+    "Tecnicatura Superior en Diseño Industrial",
+    "Tecnicatura Superior en Administración",
+    "Tecnicatura Superior en Turismo",
+]
+
+def estudiante_aleatorio(generador):
+    """Estudiante con los mismos campos y rangos que el formulario de la app"""
+    return {
+        'edad': generador.randint(17, 45),
+        'PromedioPrimerCuatrimestre': round(generador.uniform(0, 10), 1),
+        'CantMateriasAprobadasPrimerCuatrimestre': generador.randint(0, 8),
+        'CantMateriasDesaprobadasPrimerCuatrimestre': generador.randint(0, 8),
+        'AsistenciaPromedio(%)': generador.randint(0, 100),
+        'DistanciaDomicilioAlInstituto(Kms)': round(generador.uniform(0, 100), 1),
+        'genero': generador.choice(["femenino", "masculino", "otro"]),
+        'carrera': generador.choice(CARRERAS),
+        'trabaja/NoTrabaja': generador.choice(["Si", "No"]),
+        'ActividadesExtracurriculares(Estudio)': generador.choice(["Si", "No"]),
+    }
+
+def estudiantes_de_archivo(ruta):
+    """Estudiantes de un CSV o Excel, sin la columna EstadoFinal"""
+    df = pd.read_csv(ruta) if ruta.endswith('.csv') else pd.read_excel(ruta)
+    return json.loads(df.drop(columns=['EstadoFinal'], errors='ignore').to_json(orient='records', force_ascii=False))
+
+def cliente(host, puerto, cantidad, estudiantes, semilla, latencias, errores):
+    """Envía 'cantidad' pedidos de a uno, esperando cada respuesta, y guarda la latencia de cada pedido"""
+    generador = random.Random(semilla)
+    conexion = http.client.HTTPConnection(host, puerto, timeout=30)
+    propias = []
+    fallidos = 0
+    try:
+        for _ in range(cantidad):
+            estudiante = generador.choice(estudiantes) if estudiantes else estudiante_aleatorio(generador)
+            cuerpo = json.dumps(estudiante, ensure_ascii=False).encode('utf-8')
+            inicio = time.perf_counter()
+            try:
+                conexion.request('POST', '/predecir', cuerpo, {'Content-Type': 'application/json'})
+                respuesta = conexion.getresponse()
+                respuesta.read()
+                if respuesta.status != 200:
+                    fallidos += 1
+            except (OSError, http.client.HTTPException):
+                fallidos += 1
+                conexion.close()
+                conexion = http.client.HTTPConnection(host, puerto, timeout=30)
+                continue
+            propias.append(time.perf_counter() - inicio)
+    finally:
+        conexion.close()
+        latencias.extend(propias)
+        errores.append(fallidos)
+
+def consultar(host, puerto, ruta):
+    conexion = http.client.HTTPConnection(host, puerto, timeout=10)
+    try:
+        conexion.request('GET', ruta)
+        return json.loads(conexion.getresponse().read())
+    finally:
+        conexion.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prueba de carga del servicio de predicción de abandono")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=8765)
+    parser.add_argument('--clientes', type=int, default=16, help="Clientes concurrentes")
+    parser.add_argument('--pedidos', type=int, default=500, help="Pedidos por cliente")
+    parser.add_argument('--datos', help="CSV o Excel con estudiantes para enviar (por defecto aleatorios)")
+    parser.add_argument('--semilla', type=int, default=42)
+    args = parser.parse_args()
+
+    try:
+        salud = consultar(args.host, args.puerto, '/salud')
+    except OSError as e:
+        print(f"No se pudo conectar con el servicio en {args.host}:{args.puerto}: {e}")
+        raise SystemExit(1)
+    print(f"Servicio con el modelo {salud['modelo']}")
+    estudiantes = estudiantes_de_archivo(args.datos) if args.datos else None
+    antes = consultar(args.host, args.puerto, '/estadisticas')
+
+    latencias, errores = [], []
+    hilos = [threading.Thread(target=cliente, args=(args.host, args.puerto, args.pedidos, estudiantes,
+                                                    args.semilla + numero, latencias, errores))
+             for numero in range(args.clientes)]
+    inicio = time.perf_counter()
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    segundos = time.perf_counter() - inicio
+    despues = consultar(args.host, args.puerto, '/estadisticas')
+
+    latencias_ms = np.array(latencias) * 1000
+    lotes = despues['lotes'] - antes['lotes']
+    pedidos_servidor = despues['pedidos'] - antes['pedidos']
+    print(f"{args.clientes} clientes x {args.pedidos} pedidos: {len(latencias):,} respuestas, {sum(errores)} errores en {segundos:.2f} s")
+    print(f"Rendimiento: {len(latencias) / segundos:,.1f} pedidos/s")
+    if len(latencias_ms):
+        print(f"Latencia (cliente): p50 {np.percentile(latencias_ms, 50):.2f} ms | p95 {np.percentile(latencias_ms, 95):.2f} ms | "
+              f"p99 {np.percentile(latencias_ms, 99):.2f} ms | máx {latencias_ms.max():.2f} ms")
+    print(f"Lotes en el servicio: {lotes:,} ({pedidos_servidor / lotes if lotes else 0:.1f} pedidos por lote, máximo {despues['lote_maximo']})")
+    print("Estadísticas del servicio:", json.dumps(despues, ensure_ascii=False))
\ No newline at end of file
@@ -0,0 +1,335 @@
+"""Servicio local de predicción de abandono (HTTP o entrada estándar).
+
+Carga una sola vez un árbol entrenado del almacén de modelos de app_streamlitAA.py y atiende
+pedidos de predicción individuales. Los pedidos que llegan al mismo tiempo se agrupan en
+micro-lotes: cada lote se codifica y se predice con una única llamada a predict_proba
+(predecir_bloque de prediccion_abandono.py), y cada pedido recibe su fila del resultado.
+
+Uso:
+    python servicio_prediccion.py                      # HTTP en 127.0.0.1:8765 con el último modelo guardado
+    python servicio_prediccion.py --modelo <ruta.joblib> --puerto 9000
+    python servicio_prediccion.py --stdin < estudiantes.jsonl > predicciones.jsonl
+
+HTTP:
+    POST /predecir      un estudiante (objeto JSON) o una lista de estudiantes
+    GET  /estadisticas  contadores de latencia, rendimiento y tamaño de los lotes
+    GET  /salud         estado del servicio y modelo cargado
+"""
+import os
+import sys
+import json
+import glob
+import math
+import time
+import queue
+import argparse
+import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError as TiempoAgotado
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+from prediccion_abandono import preparar_codificacion, predecir_bloque
+
+DIRECTORIO_MODELOS = '.modelos_abandono'  # el mismo almacén que usa app_streamlitAA.py
+TAMANIO_LOTE = 256        # máximo de pedidos por llamada al modelo
+ESPERA_LOTE_MS = 2.0      # cuánto se espera a que lleguen más pedidos antes de predecir
+MUESTRAS_LATENCIA = 10_000  # latencias guardadas para calcular los percentiles (las más recientes)
+TIEMPO_MAXIMO_S = 10.0    # espera máxima por la respuesta de un pedido antes de devolver un error
+
+# MODELO
+def ultimo_modelo(directorio=DIRECTORIO_MODELOS):
+    """Ruta del modelo guardado más reciente del almacén, o None si no hay ninguno"""
+    rutas = glob.glob(os.path.join(directorio, '*.joblib'))
+    return max(rutas, key=os.path.getmtime) if rutas else None
+
+def cargar_modelo(ruta):
+    """Retorna (modelo, label_encoders, feature_columns) de un archivo del almacén de modelos"""
+    artefacto = joblib.load(ruta)
+    if artefacto.get('version_sklearn') != sklearn.__version__:
+        print(f"Aviso: el modelo se guardó con scikit-learn {artefacto.get('version_sklearn')} "
+              f"y se está usando {sklearn.__version__}", file=sys.stderr)
+    modelo, _, _, _, _, label_encoders, feature_columns = artefacto['resultado']
+    return modelo, label_encoders, list(feature_columns)
+
+# ESTADÍSTICAS
+class Estadisticas:
+    """Contadores del servicio: pedidos, lotes, errores y latencias (desde que se encola hasta que se responde)"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.inicio = time.perf_counter()
+        self.pedidos = 0
+        self.lotes = 0
+        self.errores = 0
+        self.segundos_modelo = 0.0
+        self.lote_maximo = 0
+        self.latencias = deque(maxlen=MUESTRAS_LATENCIA)
+
+    def registrar_lote(self, latencias, segundos_modelo, errores=0):
+        with self._lock:
+            self.pedidos += len(latencias)
+            self.lotes += 1
+            self.errores += errores
+            self.segundos_modelo += segundos_modelo
+            self.lote_maximo = max(self.lote_maximo, len(latencias))
+            self.latencias.extend(latencias)
+
+    def resumen(self):
+        with self._lock:
+            segundos = time.perf_counter() - self.inicio
+            latencias = np.array(self.latencias) * 1000
+            datos = {
+                'segundos_activo': round(segundos, 3),
+                'pedidos': self.pedidos,
+                'errores': self.errores,
+                'lotes': self.lotes,
+                'pedidos_por_lote': round(self.pedidos / self.lotes, 2) if self.lotes else 0,
+                'lote_maximo': self.lote_maximo,
+                'pedidos_por_segundo': round(self.pedidos / segundos, 1) if segundos else 0,
+                'ms_modelo_por_lote': round(self.segundos_modelo / self.lotes * 1000, 3) if self.lotes else 0,
+            }
+        for percentil in (50, 95, 99):
+            datos[f'latencia_p{percentil}_ms'] = round(float(np.percentile(latencias, percentil)), 3) if len(latencias) else 0
+        datos['latencia_maxima_ms'] = round(float(latencias.max()), 3) if len(latencias) else 0
+        return datos
+
+# MICRO-LOTES
+class AgrupadorPredicciones:
+    """Junta los pedidos que llegan mientras el modelo está ocupado (o dentro de espera_ms)
+    y los predice juntos en un hilo propio. predecir() es seguro para llamar desde varios hilos"""
+    def __init__(self, modelo, label_encoders, feature_columns,
+                 tamanio_lote=TAMANIO_LOTE, espera_ms=ESPERA_LOTE_MS):
+        self.modelo = modelo
+        self.codificacion = preparar_codificacion(label_encoders)
+        self.feature_columns = feature_columns
+        self.tamanio_lote = tamanio_lote
+        self.espera = espera_ms / 1000
+        self.estadisticas = Estadisticas()
+        self._cola = queue.Queue()
+        self._hilo = threading.Thread(target=self._procesar, name='agrupador-predicciones', daemon=True)
+        self._hilo.start()
+
+    def validar(self, estudiante):
+        """Retorna el estudiante con los valores numéricos convertidos a número.
+        Lanza ValueError si no es un diccionario o si una columna numérica no tiene un número,
+        así un pedido mal formado se rechaza solo y no hace fallar al resto del lote"""
+        if not isinstance(estudiante, dict):
+            raise ValueError("Se espera un objeto JSON con los datos del estudiante")
+        validado = dict(estudiante)
+        for col in self.feature_columns:
+            if col not in estudiante:
+                continue
+            valor = estudiante[col]
+            if isinstance(valor, (dict, list)):
+                raise ValueError(f"'{col}' debe ser un valor simple")
+            if col in self.codificacion:
+                validado[col] = str(valor)
+                continue
+            try:
+                if isinstance(valor, bool):
+                    raise ValueError
+                validado[col] = float(valor)
+                if not math.isfinite(validado[col]):
+                    raise ValueError
+            except (TypeError, ValueError):
+                raise ValueError(f"'{col}' debe ser numérico (se recibió {valor!r})") from None
+        return validado
+
+    def encolar(self, estudiante):
+        """Valida y encola un estudiante (diccionario columna -> valor) y retorna un Future con su predicción.
+        Lanza ValueError si el estudiante no es válido"""
+        validado = self.validar(estudiante)
+        futuro = Future()
+        self._cola.put((validado, futuro, time.perf_counter()))
+        return futuro
+
+    def predecir(self, estudiante, timeout=None):
+        return self.encolar(estudiante).result(timeout)
+
+    def _tomar_lote(self):
+        lote = [self._cola.get()]
+        limite = time.perf_counter() + self.espera
+        while len(lote) < self.tamanio_lote:
+            restante = limite - time.perf_counter()
+            try:
+                lote.append(self._cola.get(timeout=restante) if restante > 0 else self._cola.get_nowait())
+            except queue.Empty:
+                break
+        return lote
+
+    def _predecir(self, estudiantes):
+        """Predice una lista de estudiantes con una única llamada a predict_proba"""
+        resultado = predecir_bloque(self.modelo, pd.DataFrame(estudiantes), self.codificacion, self.feature_columns)
+        return [{
+            'prediccion': int(prediccion),
+            'probabilidad_abandono': float(probabilidad),
+            'estado': estado,
+            'riesgo': riesgo,
+        } for prediccion, probabilidad, estado, riesgo in zip(
+            resultado['Prediccion_Abandono'], resultado['Probabilidad_Abandono'],
+            resultado['Estado_Predicho'], resultado['Riesgo'])]
+
+    def _procesar(self):
+        while True:
+            lote = self._tomar_lote()
+            inicio = time.perf_counter()
+            try:
+                respuestas = self._predecir([pedido[0] for pedido in lote])
+            except Exception:
+                # Si el lote falla se predice de a uno, así solo el pedido con problemas recibe el error
+                respuestas = []
+                for estudiante, _, _ in lote:
+                    try:
+                        respuestas.append(self._predecir([estudiante])[0])
+                    except Exception as e:
+                        respuestas.append(e)
+            fin = time.perf_counter()
+            for respuesta, (_, futuro, _) in zip(respuestas, lote):
+                if isinstance(respuesta, Exception):
+                    futuro.set_exception(respuesta)
+                else:
+                    futuro.set_result(respuesta)
+            self.estadisticas.registrar_lote([fin - encolado for _, _, encolado in lote], fin - inicio,
+                                             sum(isinstance(respuesta, Exception) for respuesta in respuestas))
+
+# HTTP
+def crear_servidor(agrupador, host='127.0.0.1', puerto=8765, descripcion_modelo=None, tiempo_maximo=TIEMPO_MAXIMO_S):
+    """Retorna el servidor HTTP (un hilo por conexión) que responde con el agrupador.
+    Si las predicciones de un pedido no llegan en tiempo_maximo segundos se responde 503"""
+    class Manejador(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # conexiones persistentes para no abrir una por pedido
+        disable_nagle_algorithm = True  # sin esto cada respuesta chica espera ~40 ms el ACK retardado del cliente
+
+        def _responder(self, estado, datos):
+            cuerpo = json.dumps(datos, ensure_ascii=False).encode('utf-8')
+            self.send_response(estado)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(cuerpo)))
+            self.end_headers()
+            self.wfile.write(cuerpo)
+
+        def do_GET(self):
+            if self.path == '/estadisticas':
+                self._responder(200, agrupador.estadisticas.resumen())
+            elif self.path == '/salud':
+                self._responder(200, {'estado': 'ok', 'modelo': descripcion_modelo,
+                                      'columnas': agrupador.feature_columns})
+            else:
+                self._responder(404, {'error': f"Ruta no encontrada: {self.path}"})
+
+        def do_POST(self):
+            if self.path != '/predecir':
+                self._responder(404, {'error': f"Ruta no encontrada: {self.path}"})
+                return
+            try:
+                largo = int(self.headers.get('Content-Length', 0))
+                datos = json.loads(self.rfile.read(largo) or b'null')
+                if not isinstance(datos, (dict, list)):
+                    raise ValueError("Se espera un objeto JSON o una lista de objetos")
+                # Se valida todo el pedido antes de encolarlo: un estudiante inválido se rechaza
+                # con 400 sin llegar al lote que comparte con otros pedidos
+                validados = []
+                for posicion, estudiante in enumerate([datos] if isinstance(datos, dict) else datos):
+                    try:
+                        validados.append(agrupador.validar(estudiante))
+                    except ValueError as e:
+                        raise ValueError(e if isinstance(datos, dict) else f"estudiante {posicion}: {e}") from None
+            except ValueError as e:
+                self._responder(400, {'error': f"Pedido inválido: {e}"})
+                return
+            try:
+                futuros = [agrupador.encolar(estudiante) for estudiante in validados]
+                # Un solo plazo para todo el pedido, no uno por estudiante
+                limite = time.perf_counter() + tiempo_maximo
+                respuestas = [futuro.result(max(limite - time.perf_counter(), 0)) for futuro in futuros]
+                self._responder(200, respuestas[0] if isinstance(datos, dict) else respuestas)
+            except TiempoAgotado:
+                self._responder(503, {'error': f"No se obtuvo la predicción en {tiempo_maximo:g} s; "
+                                               "el servicio está sobrecargado, reintentar más tarde"})
+            except Exception as e:
+                self._responder(500, {'error': f"Error al predecir: {e}"})
+
+        def log_message(self, formato, *args):
+            pass  # sin una línea por pedido; los totales están en /estadisticas
+
+    class Servidor(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 128  # con la cola por defecto (5) las conexiones de muchos clientes a la vez se rechazan
+
+    return Servidor((host, puerto), Manejador)
+
+# ENTRADA ESTÁNDAR
+def atender_stdin(agrupador, entrada=sys.stdin, salida=sys.stdout, tiempo_maximo=TIEMPO_MAXIMO_S):
+    """Lee un estudiante JSON por línea y escribe una predicción JSON por línea, en el mismo orden.
+    Las líneas se encolan sin esperar la respuesta anterior, así se predicen en lotes.
+    Si una predicción no llega en tiempo_maximo segundos se escribe un error en su lugar"""
+    pendientes = queue.Queue(maxsize=agrupador.tamanio_lote * 4)
+
+    def escribir():
+        while True:
+            futuro = pendientes.get()
+            if futuro is None:
+                return
+            try:
+                respuesta = futuro.result(tiempo_maximo)
+            except TiempoAgotado:
+                respuesta = {'error': f"No se obtuvo la predicción en {tiempo_maximo:g} s"}
+            except Exception as e:
+                respuesta = {'error': str(e)}
+            salida.write(json.dumps(respuesta, ensure_ascii=False) + '\n')
+            salida.flush()
+
+    escritor = threading.Thread(target=escribir, daemon=True)
+    escritor.start()
+    for linea in entrada:
+        if not linea.strip():
+            continue
+        try:
+            estudiante = json.loads(linea)
+            if not isinstance(estudiante, dict):
+                raise ValueError("Se espera un objeto JSON por línea")
+            pendientes.put(agrupador.encolar(estudiante))
+        except ValueError as e:
+            futuro = Future()
+            futuro.set_exception(ValueError(f"Línea inválida: {e}"))
+            pendientes.put(futuro)
+    pendientes.put(None)
+    escritor.join()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servicio de predicción de abandono con micro-lotes")
+    parser.add_argument('--modelo', help=f"Archivo .joblib del almacén (por defecto el más reciente de {DIRECTORIO_MODELOS})")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=8765)
+    parser.add_argument('--stdin', action='store_true', help="Leer estudiantes JSON por línea de la entrada estándar en lugar de HTTP")
+    parser.add_argument('--tamanio-lote', type=int, default=TAMANIO_LOTE)
+    parser.add_argument('--espera-ms', type=float, default=ESPERA_LOTE_MS)
+    parser.add_argument('--tiempo-maximo', type=float, default=TIEMPO_MAXIMO_S,
+                        help="Segundos de espera por una predicción antes de responder con error")
+    args = parser.parse_args()
+
+    ruta = args.modelo or ultimo_modelo()
+    if ruta is None or not os.path.exists(ruta):
+        print(f"No se encontró un modelo entrenado en {args.modelo or DIRECTORIO_MODELOS}. "
+              "Entrenar primero el modelo en app_streamlitAA.py o indicar --modelo", file=sys.stderr)
+        sys.exit(1)
+    modelo, label_encoders, feature_columns = cargar_modelo(ruta)
+    agrupador = AgrupadorPredicciones(modelo, label_encoders, feature_columns,
+                                      args.tamanio_lote, args.espera_ms)
+
+    if args.stdin:
+        atender_stdin(agrupador, tiempo_maximo=args.tiempo_maximo)
+        print(json.dumps(agrupador.estadisticas.resumen(), ensure_ascii=False), file=sys.stderr)
+    else:
+        servidor = crear_servidor(agrupador, args.host, args.puerto, os.path.basename(ruta), args.tiempo_maximo)
+        print(f"Modelo: {ruta}", file=sys.stderr)
+        print(f"Escuchando en http://{args.host}:{args.puerto} (POST /predecir, GET /estadisticas)", file=sys.stderr)
+        try:
+            servidor.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            servidor.server_close()
+            print(json.dumps(agrupador.estadisticas.resumen(), ensure_ascii=False), file=sys.stderr)
\ No newline at end of file
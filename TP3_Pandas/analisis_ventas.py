@@ -0,0 +1,465 @@
+import io
+import json
+import hashlib
+import os
+import glob
+import numpy as np
+import pandas as pd
+from instrumentacion import instrumentar, medir
+
+# Cuadrantes de la matriz BCG en el orden en que se evalúan
+CUADRANTES_BCG = ['Estrellas', 'Vacas Lecheras', 'Interrogantes']
+COLORES_BCG = ['green', 'blue', 'orange']
+CUADRANTE_POR_DEFECTO = ('Perros', 'red')
+
+# FUNCIÓN PARA CALCULAR EL CRECIMIENTO DE CADA PRODUCTO
+def calcular_crecimiento(ventas_mensuales):
+    """
+    Recibe una matriz (productos x meses) de ingresos y retorna, para cada producto,
+    el crecimiento entre sus dos últimos meses con ventas (0 si tiene menos de dos)
+    """
+    valores = np.asarray(ventas_mensuales, dtype=float)
+    if valores.size == 0:
+        return np.zeros(len(valores))
+
+    filas = np.arange(valores.shape[0])
+    ultima_columna = valores.shape[1] - 1
+    con_ventas = valores > 0
+
+    # Último mes con ventas: primer True recorriendo las columnas desde el final
+    ultimo = ultima_columna - np.argmax(con_ventas[:, ::-1], axis=1)
+
+    # Anteúltimo mes con ventas: lo mismo sin contar el último
+    con_ventas_previas = con_ventas.copy()
+    con_ventas_previas[filas, ultimo] = False
+    anteultimo = ultima_columna - np.argmax(con_ventas_previas[:, ::-1], axis=1)
+
+    crecimiento = valores[filas, ultimo] / (valores[filas, anteultimo] + 1e-6) - 1
+    return np.where(con_ventas.sum(axis=1) >= 2, crecimiento, 0.0)
+
+# FUNCIÓN PARA ARMAR LA MATRIZ BCG
+def calcular_matriz_bcg(pivot):
+    """
+    Recibe el pivot (productos x meses) de ingresos y agrega las columnas
+    'ingresos_totales', 'crecimiento', 'cuadrante' y 'color'.
+    Retorna el pivot, el ingreso promedio y el crecimiento promedio
+    """
+    meses = list(pivot.columns)
+    pivot = pivot.copy()
+    pivot['ingresos_totales'] = pivot[meses].sum(axis=1)
+    pivot['crecimiento'] = calcular_crecimiento(pivot[meses].to_numpy())
+
+    avg_income = pivot['ingresos_totales'].mean()
+    avg_growth = pivot['crecimiento'].mean()
+
+    crece = pivot['crecimiento'].to_numpy() > avg_growth
+    ingresa = pivot['ingresos_totales'].to_numpy() > avg_income
+    condiciones = [crece & ingresa, ~crece & ingresa, crece & ~ingresa]
+
+    pivot['cuadrante'] = np.select(condiciones, CUADRANTES_BCG, default=CUADRANTE_POR_DEFECTO[0])
+    pivot['color'] = np.select(condiciones, COLORES_BCG, default=CUADRANTE_POR_DEFECTO[1])
+
+    return pivot, avg_income, avg_growth
+
+# ESQUEMA DE LAS TABLAS DE VENTAS
+# Tipos con los que se leen los CSV: los textos repetidos como categorías, los ids y cantidades
+# con el entero más chico que alcance y las fechas parseadas al leer. Los importes (precio, monto,
+# precio_unitario) quedan en int64 para que los productos cantidad * precio no desborden.
+# Una columna 'categoria' solo queda como categoría si tiene pocos valores distintos respecto de
+# las filas: en tablas chicas o con textos casi únicos (rubros, nombres de clientes) la categoría
+# ocupa más que el texto, porque guarda cada valor más un código por fila.
+FORMATO_FECHA = '%d/%m/%Y'
+PROPORCION_MAXIMA_CATEGORIA = 0.5
+ESQUEMAS = {
+    'productos': {'id_producto': 'entero', 'descripcion': 'categoria', 'id_proveedor': 'entero',
+                  'id_rubro': 'entero', 'stock': 'entero'},
+    'rubros': {'id_rubro': 'entero', 'nombre_rubro': 'categoria'},
+    'clientes': {'id_cliente': 'entero', 'nombre': 'categoria', 'id_localidad': 'entero'},
+    'facturas_encabezados': {'id_factura': 'entero', 'fecha': 'fecha', 'condicion_IVA': 'categoria',
+                             'id_sucursal': 'entero', 'id_cliente': 'entero'},
+    'facturas_detalles': {'id_facturaDET': 'entero', 'id_facturaENC': 'entero', 'id_producto': 'entero',
+                          'cantidad': 'entero'},
+    'ventas': {'id_venta': 'entero', 'id_factura': 'entero'},
+}
+
+def tabla_de_archivo(nombre):
+    """
+    Retorna la tabla de ESQUEMAS que corresponde a un nombre de archivo
+    (ej: 'facturas_detalles_simulados' -> 'facturas_detalles'), o None si no es conocida
+    """
+    for tabla in sorted(ESQUEMAS, key=len, reverse=True):
+        if nombre.startswith(tabla):
+            return tabla
+    return None
+
+def leer_csv_tipado(origen, tabla):
+    """
+    Lee un CSV aplicando el esquema de la tabla: categorías y fechas al leer,
+    y luego los enteros del esquema al ancho más chico posible. Las categorías con
+    demasiados valores distintos (ver PROPORCION_MAXIMA_CATEGORIA) se vuelven a texto.
+    origen: ruta o archivo abierto. Las tablas desconocidas se leen sin esquema
+    """
+    esquema = ESQUEMAS.get(tabla, {})
+    categorias = {columna: 'category' for columna, tipo in esquema.items() if tipo == 'categoria'}
+    fechas = [columna for columna, tipo in esquema.items() if tipo == 'fecha']
+    with medir('leer_csv_tipado', tabla) as medicion:
+        df = pd.read_csv(origen, dtype=categorias or None, parse_dates=fechas or False,
+                         date_format=FORMATO_FECHA if fechas else None)
+        for columna, tipo in esquema.items():
+            if tipo == 'entero' and columna in df.columns and pd.api.types.is_integer_dtype(df[columna]):
+                df[columna] = pd.to_numeric(df[columna], downcast='integer')
+            elif tipo == 'categoria' and columna in df.columns and \
+                    len(df[columna].cat.categories) > PROPORCION_MAXIMA_CATEGORIA * len(df):
+                df[columna] = df[columna].astype(str).where(df[columna].notna())
+        medicion.filas = len(df)
+        medicion.bytes_leidos = origen.tell() if hasattr(origen, 'tell') else os.path.getsize(origen)
+    return df
+
+def memoria_sin_esquema(df):
+    """
+    Retorna los bytes que ocuparía la tabla con los tipos por defecto de pd.read_csv
+    (enteros de 64 bits y textos para las categorías y las fechas)
+    """
+    total = df.memory_usage(index=True, deep=False)['Index']
+    for columna in df.columns:
+        serie = df[columna]
+        if isinstance(serie.dtype, pd.CategoricalDtype):
+            serie = serie.astype(str)
+        elif pd.api.types.is_datetime64_any_dtype(serie):
+            serie = serie.dt.strftime(FORMATO_FECHA)
+        elif pd.api.types.is_integer_dtype(serie):
+            serie = serie.astype('int64')
+        total += serie.memory_usage(index=False, deep=True)
+    return total
+
+def formatear_bytes(cantidad):
+    """
+    Retorna la cantidad de bytes como texto en la unidad más cómoda (B, KB, MB o GB)
+    """
+    for unidad in ['B', 'KB', 'MB']:
+        if cantidad < 1024:
+            return f"{cantidad:.1f} {unidad}"
+        cantidad /= 1024
+    return f"{cantidad:.1f} GB"
+
+def reportar_memoria(df, tabla):
+    """
+    Muestra la memoria que ocupa la tabla con el esquema y la diferencia respecto de los tipos por defecto
+    (ahorro si ocupa menos, aumento si ocupa más).
+    Retorna (bytes sin esquema, bytes con esquema)
+    """
+    antes = memoria_sin_esquema(df)
+    despues = df.memory_usage(index=True, deep=True).sum()
+    diferencia = 100 * (despues / antes - 1) if antes else 0
+    detalle = f"aumento {diferencia:.0f}%" if diferencia > 0 else f"ahorro {-diferencia:.0f}%"
+    print(f"{tabla}: {formatear_bytes(antes)} -> {formatear_bytes(despues)} ({detalle})")
+    return antes, despues
+
+# CACHÉ COLUMNAR DE LOS CSV DE VENTAS
+# Cada CSV se guarda ya tipado según su esquema en formato Parquet. El nombre del archivo en caché
+# incluye la firma del CSV de origen (fecha de modificación y tamaño, o hash del contenido para
+# archivos subidos) y la del esquema, así un CSV o un esquema modificado nunca se lee desde una caché vieja.
+DIRECTORIO_CACHE = '.cache_ventas'
+FIRMA_ESQUEMAS = hashlib.sha256(repr((sorted(ESQUEMAS.items()), PROPORCION_MAXIMA_CATEGORIA))
+                                .encode('utf-8')).hexdigest()[:8]
+
+# Columnas que usan los gráficos de cada tabla
+COLUMNAS_ANALISIS = {
+    'productos': ['id_producto', 'descripcion', 'precio', 'id_rubro'],
+    'rubros': ['id_rubro', 'nombre_rubro'],
+    'clientes': ['id_cliente', 'nombre'],
+    'facturas_encabezados': ['id_factura', 'fecha', 'id_cliente'],
+    'facturas_detalles': ['id_facturaENC', 'id_producto', 'cantidad', 'precio_unitario'],
+    'ventas': ['id_factura', 'monto'],
+}
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_DISPONIBLE = True
+except ImportError:
+    PARQUET_DISPONIBLE = False
+
+def _ruta_cache(nombre, firma, directorio_cache):
+    """
+    Retorna la ruta del archivo en caché para una tabla y la firma de su CSV
+    """
+    return os.path.join(directorio_cache, f"{nombre}-{firma}.parquet")
+
+def _leer_con_cache(nombre, tabla, firma, abrir_csv, columnas, directorio_cache):
+    """
+    Lee la tabla desde la caché si existe para esa firma; si no, la lee del CSV con su esquema,
+    informa la memoria ahorrada, la guarda en caché y borra las versiones anteriores
+    """
+    with medir('leer_tabla', nombre) as medicion:
+        if not PARQUET_DISPONIBLE:
+            df = leer_csv_tipado(abrir_csv(), tabla)
+            reportar_memoria(df, nombre)
+            medicion.filas = len(df)
+            return df[columnas] if columnas else df
+
+        firma = f"{firma}-{FIRMA_ESQUEMAS}"
+        ruta = _ruta_cache(nombre, firma, directorio_cache)
+        if os.path.exists(ruta):
+            df = pd.read_parquet(ruta, columns=columnas)
+            medicion.filas = len(df)
+            medicion.bytes_leidos = os.path.getsize(ruta)
+            return df
+
+        df = leer_csv_tipado(abrir_csv(), tabla)
+        reportar_memoria(df, nombre)
+        os.makedirs(directorio_cache, exist_ok=True)
+        for viejo in glob.glob(_ruta_cache(glob.escape(nombre), '*', glob.escape(directorio_cache))):
+            os.remove(viejo)
+        temporal = ruta + '.tmp'
+        df.to_parquet(temporal, index=False)
+        os.replace(temporal, ruta)
+        medicion.filas = len(df)
+        medicion.bytes_escritos = os.path.getsize(ruta)
+        return df[columnas] if columnas else df
+
+def leer_tabla(ruta_csv, columnas=None, directorio_cache=DIRECTORIO_CACHE, tabla=None):
+    """
+    Lee un CSV usando la caché columnar; la caché se invalida cuando cambia
+    la fecha de modificación o el tamaño del CSV
+    columnas: si se indican, solo se leen esas columnas
+    tabla: tabla de ESQUEMAS a aplicar (por defecto se deduce del nombre del archivo)
+    """
+    estado = os.stat(ruta_csv)
+    nombre = os.path.splitext(os.path.basename(ruta_csv))[0]
+    tabla = tabla or tabla_de_archivo(nombre)
+    firma = f"{estado.st_mtime_ns}-{estado.st_size}"
+    return _leer_con_cache(nombre, tabla, firma, lambda: ruta_csv, columnas, directorio_cache)
+
+def leer_tabla_subida(nombre, contenido, hash_contenido, columnas=None, directorio_cache=DIRECTORIO_CACHE):
+    """
+    Igual que leer_tabla pero para un archivo subido: la caché se identifica
+    por el hash de su contenido y nombre debe ser una tabla de ESQUEMAS
+    """
+    return _leer_con_cache(nombre, nombre, hash_contenido[:16], lambda: io.BytesIO(contenido),
+                           columnas, directorio_cache)
+
+# TABLA DE HECHOS DE VENTAS
+# Una fila por renglón de factura con la fecha y el cliente de la factura y el producto y el rubro
+# ya unidos, así los gráficos no tienen que volver a hacer merges.
+# Se guarda en la caché y, cuando se agregan facturas nuevas, solo se unen los renglones nuevos.
+# Junto a la tabla se guarda un hash de los renglones y encabezados de las facturas ya cargadas
+# para detectar si alguna se modificó.
+COLUMNAS_HECHOS = ['id_facturaENC', 'fecha', 'id_cliente', 'nombre_cliente', 'id_producto', 'descripcion',
+                   'id_rubro', 'nombre_rubro', 'cantidad', 'precio', 'precio_unitario', 'importe', 'importe_facturado']
+
+def _firma_tablas(*tablas):
+    """
+    Retorna un hash del contenido de las tablas recibidas
+    """
+    firma = hashlib.sha256()
+    for tabla in tablas:
+        firma.update(pd.util.hash_pandas_object(tabla, index=False).to_numpy().tobytes())
+    return firma.hexdigest()
+
+@instrumentar()
+def construir_hechos(productos, rubros, clientes, facturas_encabezados, facturas_detalles):
+    """
+    Une los renglones de factura con su encabezado, cliente, producto y rubro.
+    'importe' es cantidad * precio de lista e 'importe_facturado' es cantidad * precio unitario
+    """
+    hechos = pd.merge(facturas_detalles, productos, on='id_producto')
+    hechos = pd.merge(hechos, facturas_encabezados[['id_factura', 'fecha', 'id_cliente']],
+                      left_on='id_facturaENC', right_on='id_factura', how='left')
+    hechos = pd.merge(hechos, clientes[['id_cliente', 'nombre']], on='id_cliente', how='left')
+    hechos = pd.merge(hechos, rubros, on='id_rubro', how='left')
+    hechos = hechos.rename(columns={'nombre': 'nombre_cliente'})
+    hechos['importe'] = hechos['cantidad'] * hechos['precio']
+    hechos['importe_facturado'] = hechos['cantidad'] * hechos['precio_unitario']
+    # Los textos de las dimensiones se repiten en cada renglón: se guardan como categorías con todos
+    # los valores de su tabla, así los renglones que se agregan después tienen el mismo tipo
+    for columna, valores in [('descripcion', productos['descripcion']), ('nombre_rubro', rubros['nombre_rubro']),
+                             ('nombre_cliente', clientes['nombre'])]:
+        hechos[columna] = hechos[columna].astype(pd.CategoricalDtype(sorted(valores.dropna().astype(str).unique())))
+    return hechos[COLUMNAS_HECHOS]
+
+def _firma_facturas(facturas_encabezados, facturas_detalles, ids_facturas):
+    """
+    Retorna un hash de los renglones y de la fecha y el cliente de los encabezados de las facturas indicadas
+    """
+    detalles = facturas_detalles[facturas_detalles['id_facturaENC'].isin(ids_facturas)]
+    encabezados = facturas_encabezados.loc[facturas_encabezados['id_factura'].isin(ids_facturas),
+                                           ['id_factura', 'fecha', 'id_cliente']]
+    return _firma_tablas(detalles, encabezados)
+
+@instrumentar()
+def obtener_hechos(productos, rubros, clientes, facturas_encabezados, facturas_detalles,
+                   directorio_cache=DIRECTORIO_CACHE):
+    """
+    Retorna la tabla de hechos guardada, agregándole solo los renglones de las facturas nuevas.
+    Se reconstruye completa si cambian productos, rubros o clientes, o si se borraron
+    o modificaron renglones de facturas ya cargadas
+    """
+    if not PARQUET_DISPONIBLE:
+        return construir_hechos(productos, rubros, clientes, facturas_encabezados, facturas_detalles)
+
+    firma = f"{_firma_tablas(productos, rubros, clientes)[:16]}-{FIRMA_ESQUEMAS}"
+    ruta = os.path.join(directorio_cache, f"hechos_ventas-{firma}.parquet")
+    ruta_firma = os.path.join(directorio_cache, f"hechos_ventas-{firma}.json")
+
+    hechos = None
+    if os.path.exists(ruta) and os.path.exists(ruta_firma):
+        hechos = pd.read_parquet(ruta)
+        with open(ruta_firma, 'r', encoding='utf-8') as file:
+            firma_guardada = json.load(file).get('facturas')
+        cargadas = hechos['id_facturaENC'].unique()
+        nuevos = facturas_detalles[~facturas_detalles['id_facturaENC'].isin(cargadas)]
+        # Si no cuadran los renglones o cambió algún renglón o encabezado de las facturas cargadas
+        # (borrado o modificado) hay que reconstruir
+        if len(hechos) + len(nuevos) != len(facturas_detalles) or \
+                firma_guardada != _firma_facturas(facturas_encabezados, facturas_detalles, cargadas):
+            hechos = None
+        elif nuevos.empty:
+            return hechos
+        else:
+            agregados = construir_hechos(productos, rubros, clientes, facturas_encabezados, nuevos)
+            hechos = pd.concat([hechos, agregados], ignore_index=True)
+
+    if hechos is None:
+        hechos = construir_hechos(productos, rubros, clientes, facturas_encabezados, facturas_detalles)
+
+    os.makedirs(directorio_cache, exist_ok=True)
+    for viejo in glob.glob(os.path.join(glob.escape(directorio_cache), 'hechos_ventas-*')):
+        if viejo not in (ruta, ruta_firma):
+            os.remove(viejo)
+    temporal = ruta + '.tmp'
+    hechos.to_parquet(temporal, index=False)
+    os.replace(temporal, ruta)
+    with open(ruta_firma + '.tmp', 'w', encoding='utf-8') as file:
+        json.dump({'facturas': _firma_facturas(facturas_encabezados, facturas_detalles,
+                                               hechos['id_facturaENC'].unique())}, file)
+    os.replace(ruta_firma + '.tmp', ruta_firma)
+    return hechos
+
+# CUBOS DE VENTAS PRE-AGREGADOS
+# Sumas y conteos por (año, mes, semana, rubro, cliente, producto). Cualquier combinación de filtros
+# del tablero se responde recortando el cubo, cuyo tamaño depende de la cantidad de valores
+# distintos de cada dimensión y no de la cantidad de facturas.
+DIMENSIONES_TIEMPO = ['periodo', 'anio', 'mes', 'semana']
+DIMENSIONES_CUBO = DIMENSIONES_TIEMPO + ['id_rubro', 'nombre_rubro', 'nombre_cliente', 'descripcion']
+
+def _claves_tiempo(fecha):
+    """
+    Retorna las columnas de tiempo del cubo a partir de una columna de fechas
+    """
+    return pd.DataFrame({
+        'periodo': fecha.dt.to_period('M'),
+        'anio': fecha.dt.year,
+        'mes': fecha.dt.month,
+        'semana': fecha.dt.isocalendar().week,
+    })
+
+@instrumentar()
+def construir_cubo(hechos):
+    """
+    Agrega la tabla de hechos por DIMENSIONES_CUBO: suma importe, importe facturado
+    y cantidad, y cuenta los renglones
+    """
+    datos = pd.concat([_claves_tiempo(hechos['fecha']), hechos.drop(columns=['fecha'])], axis=1)
+    return datos.groupby(DIMENSIONES_CUBO, dropna=False, sort=False, observed=True).agg(
+        importe=('importe', 'sum'),
+        importe_facturado=('importe_facturado', 'sum'),
+        cantidad=('cantidad', 'sum'),
+        renglones=('importe', 'size'),
+    ).reset_index()
+
+@instrumentar()
+def construir_cubo_ventas(ventas_clientes):
+    """
+    Agrega las ventas (una fila por factura) por tiempo y cliente:
+    suma el total vendido y cuenta las facturas
+    """
+    datos = pd.concat([_claves_tiempo(ventas_clientes['fecha']), ventas_clientes[['nombre_cliente', 'total_venta']]], axis=1)
+    return datos.groupby(DIMENSIONES_TIEMPO + ['nombre_cliente'], dropna=False, sort=False, observed=True).agg(
+        total_venta=('total_venta', 'sum'),
+        facturas=('total_venta', 'size'),
+    ).reset_index()
+
+@instrumentar()
+def filtrar_cubo(cubo, anio=None, meses=None, id_rubro=None, cliente=None):
+    """
+    Recorta el cubo según los filtros indicados (None significa sin filtro)
+    """
+    filtro = pd.Series(True, index=cubo.index)
+    if anio is not None:
+        filtro &= cubo['anio'] == anio
+    if meses is not None:
+        filtro &= cubo['mes'].isin(meses)
+    if id_rubro is not None:
+        filtro &= cubo['id_rubro'] == id_rubro
+    if cliente is not None:
+        filtro &= cubo['nombre_cliente'] == cliente
+    return cubo[filtro]
+
+# CACHÉ DE GRÁFICOS
+# Guarda las imágenes ya renderizadas (bytes PNG/SVG) con una clave calculada a partir de los
+# datos agregados que se grafican y de los parámetros del gráfico. Cuando la carpeta supera
+# el tamaño máximo se borran las imágenes usadas hace más tiempo (LRU por fecha de modificación).
+DIRECTORIO_GRAFICOS = os.path.join(DIRECTORIO_CACHE, 'graficos')
+TAMANIO_MAXIMO_GRAFICOS = 50 * 1024 * 1024  # 50 MB
+
+def clave_grafico(nombre, *datos, **parametros):
+    """
+    Retorna la clave de un gráfico: hash del nombre, de los datos (DataFrames, Series u otros valores)
+    y de los parámetros
+    """
+    clave = hashlib.sha256(nombre.encode('utf-8'))
+    for dato in datos:
+        if isinstance(dato, (pd.DataFrame, pd.Series)):
+            clave.update(repr(list(dato.columns) if isinstance(dato, pd.DataFrame) else dato.name).encode('utf-8'))
+            clave.update(pd.util.hash_pandas_object(dato, index=True).to_numpy().tobytes())
+        else:
+            clave.update(repr(dato).encode('utf-8'))
+    for parametro in sorted(parametros):
+        clave.update(f"{parametro}={parametros[parametro]!r}".encode('utf-8'))
+    return clave.hexdigest()
+
+def obtener_grafico(clave, directorio=DIRECTORIO_GRAFICOS):
+    """
+    Retorna los bytes del gráfico guardado con esa clave, o None si no está en la caché
+    """
+    ruta = os.path.join(directorio, clave)
+    try:
+        with open(ruta, 'rb') as archivo:
+            contenido = archivo.read()
+        os.utime(ruta)  # marca el gráfico como usado recientemente
+        return contenido
+    except OSError:
+        return None
+
+def guardar_grafico(clave, contenido, directorio=DIRECTORIO_GRAFICOS, tamanio_maximo=TAMANIO_MAXIMO_GRAFICOS):
+    """
+    Guarda los bytes del gráfico y borra los menos usados si la caché supera tamanio_maximo
+    """
+    os.makedirs(directorio, exist_ok=True)
+    ruta = os.path.join(directorio, clave)
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, 'wb') as archivo:
+        archivo.write(contenido)
+    os.replace(temporal, ruta)
+
+    graficos = []
+    for entrada in os.scandir(directorio):
+        if entrada.name.endswith('.tmp'):
+            continue
+        # Otro proceso puede haber borrado el archivo entre el listado y la consulta
+        try:
+            if not entrada.is_file():
+                continue
+            estado = entrada.stat()
+        except OSError:
+            continue
+        graficos.append((estado.st_mtime_ns, estado.st_size, entrada.path))
+    total = sum(tamanio for _, tamanio, _ in graficos)
+    for _, tamanio, ruta_vieja in sorted(graficos):
+        if total <= tamanio_maximo:
+            break
+        try:
+            os.remove(ruta_vieja)
+        except OSError:
+            pass
+        total -= tamanio
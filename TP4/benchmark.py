@@ -0,0 +1,270 @@
+# Benchmark general - TP4
+# Genera datos sintéticos en varias escalas (generar_datos.py) y mide tiempo y memoria pico de:
+# las funciones CRUD de funcionesCSV_v3, la carga con esquema, load_data, los cubos,
+# cada función plot_* y el script de entrenamiento del TP2 (plot_generator.py).
+# Cada prueba corre en un proceso nuevo, así la memoria pico de una no se mezcla con la de otra.
+import io
+import os
+import sys
+import csv
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import multiprocessing
+from contextlib import redirect_stdout
+from generar_datos import generar_datos, ARCHIVO_PROMOCIONES
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DIRECTORIO_TP4 = os.path.dirname(os.path.abspath(__file__))
+SCRIPT_ML = os.path.join(DIRECTORIO_TP4, '..', 'TP2_Guía_AA', 'plot_generator.py')
+OPERACIONES_CRUD = 1_000  # registros por prueba CRUD (se cambia con --operaciones)
+LIMITE_CARGA_COMPLETA = 2_000_000  # csv_a_diccionarios arma un dict por fila: no se mide por encima de esto
+
+# MEMORIA PICO DEL PROCESO
+def memoria_pico():
+    """
+    Retorna la memoria pico del proceso en MB (None si no se puede medir en esta plataforma)
+    """
+    # En Linux ru_maxrss conserva el pico del proceso padre después del exec: se lee el pico propio (VmHWM)
+    try:
+        with open('/proc/self/status', encoding='utf-8') as estado:
+            for linea in estado:
+                if linea.startswith('VmHWM:'):
+                    return int(linea.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / 1024 / 1024 if sys.platform == 'darwin' else pico / 1024
+
+# PREPARACIONES (no se cronometran)
+def copiar_detalles(directorio):
+    """
+    Copia facturas_detalles.csv a un temporal para que las pruebas CRUD no modifiquen los datos generados
+    """
+    destino = os.path.join(tempfile.mkdtemp(), 'facturas_detalles.csv')
+    shutil.copyfile(os.path.join(directorio, 'facturas_detalles.csv'), destino)
+    return destino
+
+def cargar_tablas(directorio):
+    from analisis_ventas import leer_csv_tipado, COLUMNAS_ANALISIS
+    from generar_reportes import buscar_archivo
+    return {tabla: leer_csv_tipado(buscar_archivo(directorio, tabla), tabla)[columnas]
+            for tabla, columnas in COLUMNAS_ANALISIS.items()}
+
+def cargar_cubos(directorio):
+    from reportes import construir_cubos
+    return construir_cubos(**cargar_tablas(directorio))
+
+def numeros_al_azar(archivo, semilla):
+    from funcionesCSV_v3 import contar_registros_csv
+    total = contar_registros_csv(archivo)
+    rng = random.Random(semilla)
+    return archivo, total, [rng.randrange(total) for _ in range(OPERACIONES_CRUD)]
+
+# PRUEBAS: cada una recibe el directorio de datos y la semilla, y retorna (preparar, ejecutar)
+def prueba_contar(directorio, semilla):
+    from funcionesCSV_v3 import contar_registros_csv
+    return lambda: os.path.join(directorio, 'facturas_detalles.csv'), contar_registros_csv
+
+def prueba_csv_a_diccionarios(directorio, semilla):
+    from funcionesCSV_v3 import csv_a_diccionarios
+    return lambda: os.path.join(directorio, 'facturas_detalles.csv'), csv_a_diccionarios
+
+def prueba_tabla_offsets(directorio, semilla):
+    from funcionesCSV_v3 import tabla_offsets_csv
+    return lambda: os.path.join(directorio, 'facturas_detalles.csv'), tabla_offsets_csv
+
+def prueba_obtener_por_numero(directorio, semilla):
+    from funcionesCSV_v3 import obtener_registro_por_numero, tabla_offsets_csv
+    def preparar():
+        archivo, _, numeros = numeros_al_azar(os.path.join(directorio, 'facturas_detalles.csv'), semilla)
+        tabla_offsets_csv(archivo)
+        return archivo, numeros
+    def ejecutar(datos):
+        archivo, numeros = datos
+        for numero in numeros:
+            obtener_registro_por_numero(archivo, numero)
+    return preparar, ejecutar
+
+def prueba_buscar_por_id(directorio, semilla):
+    from funcionesCSV_v3 import buscar_por_id, cargar_indice
+    def preparar():
+        archivo = copiar_detalles(directorio)
+        _, _, numeros = numeros_al_azar(archivo, semilla)
+        cargar_indice(archivo)
+        return archivo, [numero + 1 for numero in numeros]
+    def ejecutar(datos):
+        archivo, ids = datos
+        for valor_id in ids:
+            buscar_por_id(archivo, valor_id)
+    return preparar, ejecutar
+
+def prueba_agregar(directorio, semilla):
+    from funcionesCSV_v3 import agregar_registros
+    def preparar():
+        archivo = copiar_detalles(directorio)
+        rng = random.Random(semilla)
+        return archivo, [{'id_facturaDET': str(i), 'id_facturaENC': str(rng.randint(1, 1000)), 'id_producto': '1',
+                          'cantidad': str(rng.randint(1, 5)), 'precio_unitario': '1000'}
+                         for i in range(OPERACIONES_CRUD)]
+    return preparar, lambda datos: agregar_registros(*datos)
+
+def prueba_modificar(directorio, semilla):
+    from funcionesCSV_v3 import modificar_registros
+    def preparar():
+        archivo, _, numeros = numeros_al_azar(copiar_detalles(directorio), semilla)
+        return archivo, {numero: {'cantidad': '9'} for numero in numeros}
+    return preparar, lambda datos: modificar_registros(*datos)
+
+def prueba_borrar(directorio, semilla):
+    from funcionesCSV_v3 import borrar_por_indice
+    def preparar():
+        archivo, _, numeros = numeros_al_azar(copiar_detalles(directorio), semilla)
+        return archivo, numeros
+    return preparar, lambda datos: borrar_por_indice(*datos)
+
+def prueba_leer_con_esquema(directorio, semilla):
+    return lambda: directorio, cargar_tablas
+
+def prueba_load_data(directorio, semilla):
+    from reportes import load_data
+    return lambda: cargar_tablas(directorio), lambda tablas: load_data(**tablas)
+
+def prueba_cubos(directorio, semilla):
+    from reportes import construir_cubos
+    return lambda: cargar_tablas(directorio), lambda tablas: construir_cubos(**tablas)
+
+def prueba_grafico(nombre_funcion, usa_detalle):
+    def prueba(directorio, semilla):
+        import graficos
+        plot_func = getattr(graficos, nombre_funcion)
+        def preparar():
+            cubo_ventas, cubo_detalle = cargar_cubos(directorio)
+            return cubo_detalle if usa_detalle else cubo_ventas
+        return preparar, lambda cubo: graficos.renderizar_png(plot_func, [cubo])
+    return prueba
+
+def prueba_ml(directorio, semilla):
+    import runpy
+    def preparar():
+        destino = tempfile.mkdtemp()
+        shutil.copyfile(os.path.join(directorio, ARCHIVO_PROMOCIONES), os.path.join(destino, ARCHIVO_PROMOCIONES))
+        return destino
+    def ejecutar(destino):
+        os.chdir(destino)
+        sys.path.insert(0, os.path.dirname(SCRIPT_ML))  # el script importa modelo_recompra de su carpeta
+        runpy.run_path(SCRIPT_ML, run_name='__main__')
+    return preparar, ejecutar
+
+PRUEBAS = {
+    'csv: contar_registros_csv': prueba_contar,
+    'csv: csv_a_diccionarios': prueba_csv_a_diccionarios,
+    'csv: tabla_offsets_csv': prueba_tabla_offsets,
+    'csv: obtener_registro_por_numero': prueba_obtener_por_numero,
+    'csv: buscar_por_id': prueba_buscar_por_id,
+    'csv: agregar_registros': prueba_agregar,
+    'csv: modificar_registros': prueba_modificar,
+    'csv: borrar_por_indice': prueba_borrar,
+    'pandas: leer CSV con esquema': prueba_leer_con_esquema,
+    'pandas: load_data': prueba_load_data,
+    'pandas: construir_cubos': prueba_cubos,
+    'grafico: plot_ranking_clientes': prueba_grafico('plot_ranking_clientes', False),
+    'grafico: plot_ventas_mensuales': prueba_grafico('plot_ventas_mensuales', False),
+    'grafico: plot_ventas_semanales_septiembre': prueba_grafico('plot_ventas_semanales_septiembre', False),
+    'grafico: plot_ventas_por_rubro': prueba_grafico('plot_ventas_por_rubro', True),
+    'grafico: plot_ranking_productos': prueba_grafico('plot_ranking_productos', True),
+    'grafico: plot_bcg_matrix': prueba_grafico('plot_bcg_matrix', True),
+    'ml: plot_generator.py (TP2)': prueba_ml,
+}
+
+def _correr_prueba(nombre, directorio, semilla, operaciones, conexion):
+    """
+    Corre una prueba en el proceso actual y envía (segundos, MB antes, MB pico) o el error por la conexión
+    """
+    global OPERACIONES_CRUD
+    OPERACIONES_CRUD = operaciones
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        os.chdir(tempfile.mkdtemp())  # las cachés de datos y gráficos arrancan vacías
+        preparar, ejecutar = PRUEBAS[nombre](directorio, semilla)
+        with redirect_stdout(io.StringIO()):
+            datos = preparar()
+            memoria_antes = memoria_pico()
+            inicio = time.perf_counter()
+            ejecutar(datos)
+            segundos = time.perf_counter() - inicio
+        conexion.send((segundos, memoria_antes, memoria_pico()))
+    except Exception as e:
+        conexion.send(e)
+
+def medir(nombre, directorio, semilla, operaciones=OPERACIONES_CRUD):
+    """
+    Corre la prueba en un proceso nuevo y retorna (segundos, MB antes, MB pico)
+    """
+    contexto = multiprocessing.get_context('spawn')
+    receptor, emisor = contexto.Pipe(duplex=False)
+    proceso = contexto.Process(target=_correr_prueba, args=(nombre, directorio, semilla, operaciones, emisor))
+    proceso.start()
+    emisor.close()
+    try:
+        resultado = receptor.recv()
+    except EOFError:
+        resultado = RuntimeError(f"el proceso terminó con código {proceso.exitcode}")
+    proceso.join()
+    if isinstance(resultado, Exception):
+        raise resultado
+    return resultado
+
+def formatear_mb(valor):
+    return '-' if valor is None else f"{valor:,.1f}"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de CRUD, carga, gráficos y ML con datos sintéticos")
+    parser.add_argument('--filas', type=int, nargs='+', default=[10_000, 1_000_000],
+                        help="Escalas a medir (renglones de factura), ej: 10000 1000000 10000000")
+    parser.add_argument('--semilla', type=int, default=42)
+    parser.add_argument('--directorio', default=os.path.join(tempfile.gettempdir(), 'benchmark_tp4'),
+                        help="Donde se generan los datos sintéticos")
+    parser.add_argument('--operaciones', type=int, default=OPERACIONES_CRUD,
+                        help="Registros por prueba CRUD (buscar, obtener, agregar, modificar y borrar)")
+    parser.add_argument('--pruebas', nargs='+', help="Solo las pruebas cuyo nombre contenga alguno de estos textos")
+    parser.add_argument('--resultados', help="Guardar los resultados en este CSV")
+    args = parser.parse_args()
+
+    pruebas = [nombre for nombre in PRUEBAS if not args.pruebas or any(texto in nombre for texto in args.pruebas)]
+    resultados = []
+    print(f"Pruebas CRUD de a un registro: {args.operaciones:,} operaciones cada una")
+    print(f"{'Filas':>12} | {'Prueba':<45} | {'Segundos':>9} | {'MB antes':>9} | {'MB pico':>9}")
+    for filas in args.filas:
+        directorio = os.path.join(args.directorio, f"{filas}_{args.semilla}")
+        inicio = time.perf_counter()
+        generar_datos(directorio, filas, args.semilla)
+        print(f"{filas:>12,} | {'generar datos':<45} | {time.perf_counter() - inicio:>9.3f} | {'-':>9} | {'-':>9}")
+
+        for nombre in pruebas:
+            if nombre == 'csv: csv_a_diccionarios' and filas > LIMITE_CARGA_COMPLETA:
+                print(f"{filas:>12,} | {nombre:<45} | omitida (más de {LIMITE_CARGA_COMPLETA:,} filas)")
+                continue
+            try:
+                segundos, antes, pico = medir(nombre, os.path.abspath(directorio), args.semilla, args.operaciones)
+            except Exception as e:
+                print(f"{filas:>12,} | {nombre:<45} | error: {e}")
+                continue
+            resultados.append([filas, nombre, round(segundos, 4), antes, pico])
+            print(f"{filas:>12,} | {nombre:<45} | {segundos:>9.3f} | {formatear_mb(antes):>9} | {formatear_mb(pico):>9}")
+
+    if args.resultados:
+        with open(args.resultados, 'w', newline='', encoding='utf-8') as archivo:
+            writer = csv.writer(archivo)
+            writer.writerow(['filas', 'prueba', 'segundos', 'mb_antes', 'mb_pico'])
+            writer.writerows(resultados)
+        print(f"Resultados guardados en {args.resultados}")
\ No newline at end of file
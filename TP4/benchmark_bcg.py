@@ -0,0 +1,75 @@
+# Benchmark - Matriz BCG
+# Compara el cálculo original del crecimiento y los cuadrantes (iterrows + apply)
+# con la versión vectorizada de analisis_ventas.calcular_matriz_bcg
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from analisis_ventas import calcular_matriz_bcg
+
+# Versión original, tal como estaba en plot_bcg_matrix
+def matriz_bcg_original(pivot):
+    pivot = pivot.copy()
+    pivot['ingresos_totales'] = pivot.sum(axis=1)
+    pivot['crecimiento'] = 0.0
+
+    for index, row in pivot.iterrows():
+        monthly_sales = row.drop('ingresos_totales')
+        monthly_sales = monthly_sales[monthly_sales > 0]
+        if len(monthly_sales) >= 2:
+            last_month_sales = monthly_sales.iloc[-1]
+            second_last_month_sales = monthly_sales.iloc[-2]
+            pivot.loc[index, 'crecimiento'] = last_month_sales / (second_last_month_sales + 1e-6) - 1
+
+    avg_income = pivot['ingresos_totales'].mean()
+    avg_growth = pivot['crecimiento'].mean()
+
+    def assign_quadrant(row):
+        if row['crecimiento'] > avg_growth and row['ingresos_totales'] > avg_income:
+            return 'Estrellas', 'green'
+        elif row['crecimiento'] <= avg_growth and row['ingresos_totales'] > avg_income:
+            return 'Vacas Lecheras', 'blue'
+        elif row['crecimiento'] > avg_growth and row['ingresos_totales'] <= avg_income:
+            return 'Interrogantes', 'orange'
+        else:
+            return 'Perros', 'red'
+
+    pivot[['cuadrante', 'color']] = pivot.apply(assign_quadrant, axis=1, result_type='expand')
+    return pivot, avg_income, avg_growth
+
+# Genera un pivot productos x meses con ventas esparcidas (muchos meses en cero)
+def generar_pivot(productos, meses=12, semilla=42):
+    rng = np.random.default_rng(semilla)
+    valores = rng.uniform(1_000, 1_000_000, size=(productos, meses))
+    valores[rng.random((productos, meses)) < 0.4] = 0
+    columnas = [f'2025-{mes:02d}' for mes in range(1, meses + 1)]
+    indice = [f'Producto {i}' for i in range(productos)]
+    return pd.DataFrame(valores, index=indice, columns=columnas)
+
+def medir(funcion, pivot, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion(pivot)
+        tiempos.append(time.perf_counter() - inicio)
+    return min(tiempos), resultado
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark del cálculo de la matriz BCG")
+    parser.add_argument('--productos', type=int, nargs='+', default=[100, 1_000, 5_000])
+    parser.add_argument('--repeticiones', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'Productos':>10} | {'Original (s)':>12} | {'Vectorizado (s)':>15} | {'Aceleración':>11}")
+    print("-" * 58)
+    for productos in args.productos:
+        pivot = generar_pivot(productos)
+        t_original, (esperado, _, _) = medir(matriz_bcg_original, pivot, args.repeticiones)
+        t_vectorizado, (obtenido, _, _) = medir(lambda p: calcular_matriz_bcg(p), pivot, args.repeticiones)
+
+        # Los dos métodos tienen que dar el mismo resultado
+        np.testing.assert_allclose(obtenido['crecimiento'], esperado['crecimiento'])
+        assert (obtenido['cuadrante'] == esperado['cuadrante']).all()
+        assert (obtenido['color'] == esperado['color']).all()
+
+        print(f"{productos:>10} | {t_original:>12.4f} | {t_vectorizado:>15.4f} | {t_original / t_vectorizado:>10.0f}x")
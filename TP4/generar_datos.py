@@ -0,0 +1,159 @@
+# Generador de datos sintéticos - TP4
+# Genera los CSV de ventas (clientes, productos, rubros, facturas_encabezados, facturas_detalles y ventas)
+# con las mismas columnas que los del repositorio, en la escala pedida y reproducibles por semilla.
+# También genera el Excel de clientes y promociones que usan los scripts de Machine Learning del TP2.
+import os
+import argparse
+import numpy as np
+import pandas as pd
+
+RUBROS = ['computación', 'perifericos', 'audiovisual', 'sonido', 'telefonía', 'gaming', 'redes', 'hogar']
+NOMBRES = ['Ana', 'Luis', 'Carlos', 'María', 'Sofía', 'Federico', 'Lucía', 'Jorge', 'Paula', 'Martín']
+APELLIDOS = ['Gómez', 'Martínez', 'Pérez', 'Ramírez', 'López', 'Fernández', 'Díaz', 'Romero', 'Sosa', 'Torres']
+CONDICIONES_IVA = ['Consumidor Final', 'Responsable Inscripto', 'Monotributista', 'Exento']
+FECHA_INICIAL = pd.Timestamp('2024-01-01')
+DIAS = 730  # dos años de facturas
+MAXIMO_PRODUCTOS = 2_000
+MAXIMO_CLIENTES = 50_000
+FACTURAS_POR_BLOQUE = 500_000
+ARCHIVO_PROMOCIONES = 'Mini_Proyecto_Clientes_Promociones.xlsx'
+
+def generar_rubros():
+    return pd.DataFrame({'id_rubro': range(1, len(RUBROS) + 1), 'nombre_rubro': RUBROS})
+
+def generar_productos(rng, cantidad):
+    id_rubro = rng.integers(1, len(RUBROS) + 1, cantidad)
+    return pd.DataFrame({
+        'id_producto': np.arange(1, cantidad + 1),
+        'descripcion': [f"{RUBROS[rubro - 1].capitalize()} modelo {i}" for i, rubro in enumerate(id_rubro, start=1)],
+        'precio': rng.integers(10, 700, cantidad) * 1_000,
+        'id_proveedor': rng.integers(1, 21, cantidad),
+        'id_rubro': id_rubro,
+        'stock': rng.integers(0, 100, cantidad),
+    })
+
+def generar_clientes(rng, cantidad):
+    nombres = rng.choice(NOMBRES, cantidad)
+    apellidos = rng.choice(APELLIDOS, cantidad)
+    return pd.DataFrame({
+        'id_cliente': np.arange(1, cantidad + 1),
+        'nombre': [f"{nombre} {apellido} {i}" for i, (nombre, apellido) in enumerate(zip(nombres, apellidos), start=1)],
+        'id_localidad': rng.integers(1, 16, cantidad),
+        'domicilio': [f"Calle {numero} {altura}" for numero, altura in zip(rng.integers(1, 200, cantidad), rng.integers(1, 5_000, cantidad))],
+    })
+
+def generar_bloque_facturas(rng, primera_factura, primer_detalle, renglones, productos, cantidad_clientes):
+    """
+    Genera las facturas de un bloque: 'renglones' tiene la cantidad de renglones de cada factura.
+    Retorna (encabezados, detalles, ventas)
+    """
+    cantidad = len(renglones)
+    ids_factura = np.arange(primera_factura, primera_factura + cantidad)
+    dias = np.sort(rng.integers(0, DIAS, cantidad))
+    fechas = FECHA_INICIAL + pd.to_timedelta(dias, unit='D')
+    encabezados = pd.DataFrame({
+        'id_factura': ids_factura,
+        'numero': [f"F-{id_factura:07d}" for id_factura in ids_factura],
+        'fecha': fechas.strftime('%d/%m/%Y'),
+        'condicion_IVA': rng.choice(CONDICIONES_IVA, cantidad, p=[0.7, 0.15, 0.1, 0.05]),
+        'id_sucursal': rng.integers(1, 6, cantidad),
+        'id_cliente': rng.integers(1, cantidad_clientes + 1, cantidad),
+    })
+
+    total_renglones = int(renglones.sum())
+    # Algunos productos se venden mucho más que otros
+    popularidad = 1 / np.arange(1, len(productos) + 1) ** 0.8
+    posiciones = rng.choice(len(productos), total_renglones, p=popularidad / popularidad.sum())
+    cantidades = rng.integers(1, 6, total_renglones)
+    precios = productos['precio'].to_numpy()[posiciones]
+    id_factura_renglon = np.repeat(ids_factura, renglones)
+    detalles = pd.DataFrame({
+        'id_facturaDET': np.arange(primer_detalle, primer_detalle + total_renglones),
+        'id_facturaENC': id_factura_renglon,
+        'id_producto': productos['id_producto'].to_numpy()[posiciones],
+        'cantidad': cantidades,
+        'precio_unitario': precios,
+    })
+
+    montos = np.bincount(id_factura_renglon - primera_factura, weights=cantidades * precios, minlength=cantidad)
+    ventas = pd.DataFrame({'id_venta': ids_factura, 'id_factura': ids_factura, 'monto': montos.astype('int64')})
+    return encabezados, detalles, ventas
+
+def generar_promociones(rng, cantidad):
+    """
+    Genera el dataset de clientes y promociones del TP2 (mismas columnas que el Excel original).
+    La recompra sigue una regla fija sin ruido, así el árbol de decisión queda de tamaño acotado
+    """
+    recibio = rng.random(cantidad) < 0.5
+    monto = np.where(recibio, rng.integers(3, 9, cantidad) * 100, 0)
+    total_compras = rng.integers(1, 7, cantidad)
+    recompra = (recibio & (monto >= 500)) | (total_compras >= 5)
+    return pd.DataFrame({
+        'Cliente_ID': np.arange(1, cantidad + 1),
+        'Genero': rng.choice(['F', 'M'], cantidad),
+        'Edad': rng.integers(18, 71, cantidad),
+        'Recibio_Promo': np.where(recibio, 'Si', 'No'),
+        'Monto_Promo': monto,
+        'Recompra': np.where(recompra, 'Si', 'No'),
+        'Total_Compras': total_compras,
+        'Ingreso_Mensual': rng.integers(25, 66, cantidad) * 1_000,
+    })
+
+def generar_datos(directorio, filas, semilla=42, filas_promociones=None):
+    """
+    Genera todos los archivos en 'directorio'. 'filas' es la cantidad de renglones de factura
+    (facturas_detalles); las demás tablas se escalan a partir de ella.
+    Retorna un diccionario {archivo: cantidad de filas}
+    """
+    rng = np.random.default_rng(semilla)
+    os.makedirs(directorio, exist_ok=True)
+    cantidad_productos = min(MAXIMO_PRODUCTOS, max(12, filas // 1_000))
+    cantidad_clientes = min(MAXIMO_CLIENTES, max(10, filas // 200))
+
+    rubros = generar_rubros()
+    productos = generar_productos(rng, cantidad_productos)
+    clientes = generar_clientes(rng, cantidad_clientes)
+    rubros.to_csv(os.path.join(directorio, 'rubros.csv'), index=False)
+    productos.to_csv(os.path.join(directorio, 'productos.csv'), index=False)
+    clientes.to_csv(os.path.join(directorio, 'clientes.csv'), index=False)
+    resumen = {'rubros.csv': len(rubros), 'productos.csv': len(productos), 'clientes.csv': len(clientes)}
+
+    # Entre 1 y 3 renglones por factura, recortando la última para llegar justo a 'filas'
+    renglones = rng.integers(1, 4, filas)
+    acumulado = np.cumsum(renglones)
+    cantidad_facturas = int(np.searchsorted(acumulado, filas)) + 1
+    renglones = renglones[:cantidad_facturas]
+    renglones[-1] -= int(acumulado[cantidad_facturas - 1] - filas)
+
+    archivos = {'facturas_encabezados.csv': 0, 'facturas_detalles.csv': 0, 'ventas.csv': 0}
+    primera_factura, primer_detalle = 1, 1
+    for inicio in range(0, cantidad_facturas, FACTURAS_POR_BLOQUE):
+        bloque = renglones[inicio:inicio + FACTURAS_POR_BLOQUE]
+        tablas = generar_bloque_facturas(rng, primera_factura, primer_detalle, bloque, productos, cantidad_clientes)
+        for nombre, tabla in zip(archivos, tablas):
+            tabla.to_csv(os.path.join(directorio, nombre), index=False, mode='w' if inicio == 0 else 'a', header=inicio == 0)
+            archivos[nombre] += len(tabla)
+        primera_factura += len(bloque)
+        primer_detalle += int(bloque.sum())
+    resumen.update(archivos)
+
+    if filas_promociones is None:
+        filas_promociones = min(filas, 50_000)
+    if filas_promociones:
+        promociones = generar_promociones(rng, filas_promociones)
+        promociones.to_excel(os.path.join(directorio, ARCHIVO_PROMOCIONES), index=False)
+        resumen[ARCHIVO_PROMOCIONES] = len(promociones)
+    return resumen
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera datos de ventas sintéticos compatibles con los CSV del TP4")
+    parser.add_argument('--filas', type=int, default=10_000, help="Renglones de factura (ej: 10000, 1000000, 10000000)")
+    parser.add_argument('--semilla', type=int, default=42)
+    parser.add_argument('--salida', default='datos_sinteticos')
+    parser.add_argument('--promociones', type=int, help="Filas del Excel de promociones (por defecto min(filas, 50000); 0 para no generarlo)")
+    args = parser.parse_args()
+
+    resumen = generar_datos(args.salida, args.filas, args.semilla, args.promociones)
+    for archivo, cantidad in resumen.items():
+        print(f"{archivo}: {cantidad:,} filas")
+    print(f"Datos generados en {args.salida}")
\ No newline at end of file
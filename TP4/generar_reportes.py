@@ -0,0 +1,159 @@
+# Generador de informes por lotes - TP4
+# Genera sin la interfaz de Streamlit el informe PDF y los rankings CSV/JSON de cada cliente
+# y de cada rubro. Los datos se cargan una sola vez y los informes se reparten entre varios procesos.
+import os
+import re
+import sys
+import time
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import matplotlib
+from analisis_ventas import leer_tabla, filtrar_cubo, COLUMNAS_ANALISIS
+from reportes import construir_cubos, ranking_clientes, ranking_productos, generate_csv, generate_json, generate_pdf_report
+
+# Sufijos con los que se buscan los CSV de cada tabla (ej: ventas.csv o ventas_simuladas.csv)
+SUFIJOS_ARCHIVOS = ['', '_simulados', '_simuladas']
+ANCHO_BARRA = 30
+
+# Datos compartidos por los informes de cada proceso trabajador (se cargan una vez por proceso)
+_datos = None
+
+def buscar_archivo(directorio, tabla):
+    """
+    Retorna la ruta del CSV de la tabla dentro del directorio
+    """
+    for sufijo in SUFIJOS_ARCHIVOS:
+        ruta = os.path.join(directorio, f"{tabla}{sufijo}.csv")
+        if os.path.exists(ruta):
+            return ruta
+    raise FileNotFoundError(f"No se encontró el archivo de {tabla} en {directorio}")
+
+def cargar_datos(directorio):
+    """
+    Lee los seis CSV (usando la caché columnar) y arma los cubos de ventas.
+    Retorna (rubros, cubo_ventas, cubo_detalle)
+    """
+    tablas = {tabla: leer_tabla(buscar_archivo(directorio, tabla), columnas)
+              for tabla, columnas in COLUMNAS_ANALISIS.items()}
+    cubo_ventas, cubo_detalle = construir_cubos(**tablas)
+    return tablas['rubros'], cubo_ventas, cubo_detalle
+
+def nombre_archivo(texto):
+    """
+    Convierte un nombre de cliente o rubro en un nombre de carpeta válido
+    """
+    return re.sub(r'[^\w\-]+', '_', str(texto)).strip('_') or 'sin_nombre'
+
+def _iniciar_proceso(datos):
+    global _datos
+    matplotlib.use('Agg')
+    _datos = datos
+
+def generar_informe(tarea):
+    """
+    Genera el informe PDF y el ranking de productos (CSV y JSON) de un cliente o un rubro.
+    tarea: ('cliente', nombre) o ('rubro', nombre)
+    Retorna (tarea, segundos, bytes escritos)
+    """
+    inicio = time.perf_counter()
+    tipo, nombre = tarea
+    rubros, cubo_ventas, cubo_detalle, anio, meses, salida = _datos
+
+    filtered_ventas = filtrar_cubo(cubo_ventas, anio=anio, meses=meses)
+    if tipo == 'cliente':
+        filtered_ventas = filtrar_cubo(filtered_ventas, cliente=nombre)
+        filtered_detalle = filtrar_cubo(cubo_detalle, cliente=nombre)
+        rubro, cliente = "Todos", nombre
+    else:
+        id_rubro = rubros.loc[rubros['nombre_rubro'] == nombre, 'id_rubro'].iloc[0]
+        filtered_detalle = filtrar_cubo(cubo_detalle, id_rubro=id_rubro)
+        rubro, cliente = nombre, None
+
+    carpeta = os.path.join(salida, f"{tipo}s", nombre_archivo(nombre))
+    os.makedirs(carpeta, exist_ok=True)
+    ranking = ranking_productos(filtered_detalle)
+    archivos = {
+        'informe_ventas.pdf': generate_pdf_report(None, filtered_ventas, filtered_detalle, rubros, meses, rubro, cliente),
+        'ranking_productos.csv': generate_csv(ranking),
+        'ranking_productos.json': generate_json(ranking),
+    }
+    for nombre_salida, contenido in archivos.items():
+        with open(os.path.join(carpeta, nombre_salida), 'wb') as archivo:
+            archivo.write(contenido)
+
+    return tarea, time.perf_counter() - inicio, sum(len(contenido) for contenido in archivos.values())
+
+def mostrar_progreso(terminados, total, inicio):
+    """
+    Dibuja la barra de progreso con la velocidad y el tiempo restante estimado
+    """
+    transcurrido = time.perf_counter() - inicio
+    velocidad = terminados / transcurrido if transcurrido > 0 else 0
+    restante = (total - terminados) / velocidad if velocidad > 0 else 0
+    llenos = ANCHO_BARRA * terminados // total if total else ANCHO_BARRA
+    barra = '#' * llenos + '-' * (ANCHO_BARRA - llenos)
+    sys.stdout.write(f"\r[{barra}] {terminados}/{total} | {velocidad:.1f} informes/s | restan {restante:.0f}s ")
+    sys.stdout.flush()
+
+def mostrar_estadisticas(tiempos, bytes_escritos, errores, total_segundos, procesos):
+    """
+    Muestra el resumen de la corrida
+    """
+    print(f"\nInformes generados: {len(tiempos)} | Errores: {len(errores)} | Procesos: {procesos}")
+    print(f"Tiempo total: {total_segundos:.2f}s | Velocidad: {len(tiempos) / total_segundos:.2f} informes/s"
+          f" | Escrito: {bytes_escritos / 1024 / 1024:.1f} MB")
+    if tiempos:
+        ordenados = sorted(tiempos)
+        p95 = ordenados[min(len(ordenados) - 1, int(len(ordenados) * 0.95))]
+        print(f"Tiempo por informe: promedio {sum(tiempos) / len(tiempos):.2f}s | mínimo {ordenados[0]:.2f}s"
+              f" | p95 {p95:.2f}s | máximo {ordenados[-1]:.2f}s")
+    for (tipo, nombre), error in errores:
+        print(f"Error en el informe del {tipo} {nombre}: {error}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera los informes de ventas de cada cliente y cada rubro")
+    parser.add_argument('--datos', default='.', help="Directorio con los CSV de ventas")
+    parser.add_argument('--salida', default='informes', help="Directorio donde se guardan los informes")
+    parser.add_argument('--anio', type=int, help="Año de las ventas (por defecto el último)")
+    parser.add_argument('--meses', type=int, nargs='+', default=list(range(1, 13)))
+    parser.add_argument('--solo', choices=['clientes', 'rubros'], help="Generar solo los informes de clientes o de rubros")
+    parser.add_argument('--procesos', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    rubros, cubo_ventas, cubo_detalle = cargar_datos(args.datos)
+    anio = args.anio if args.anio is not None else int(cubo_ventas['anio'].max())
+    print(f"Datos cargados en {time.perf_counter() - inicio:.2f}s")
+
+    # Ranking general de clientes del período
+    os.makedirs(args.salida, exist_ok=True)
+    ranking = ranking_clientes(filtrar_cubo(cubo_ventas, anio=anio, meses=args.meses))
+    with open(os.path.join(args.salida, 'ranking_clientes.csv'), 'wb') as archivo:
+        archivo.write(generate_csv(ranking))
+    with open(os.path.join(args.salida, 'ranking_clientes.json'), 'wb') as archivo:
+        archivo.write(generate_json(ranking))
+
+    tareas = []
+    if args.solo != 'rubros':
+        tareas += [('cliente', nombre) for nombre in cubo_ventas['nombre_cliente'].dropna().unique()]
+    if args.solo != 'clientes':
+        tareas += [('rubro', nombre) for nombre in rubros['nombre_rubro'].unique()]
+
+    datos = (rubros, cubo_ventas, cubo_detalle, anio, args.meses, args.salida)
+    tiempos, errores, bytes_escritos = [], [], 0
+    inicio = time.perf_counter()
+    mostrar_progreso(0, len(tareas), inicio)
+    with ProcessPoolExecutor(max_workers=args.procesos, mp_context=multiprocessing.get_context('spawn'),
+                             initializer=_iniciar_proceso, initargs=(datos,)) as pool:
+        futuros = {pool.submit(generar_informe, tarea): tarea for tarea in tareas}
+        for terminados, futuro in enumerate(as_completed(futuros), start=1):
+            try:
+                _, segundos, escritos = futuro.result()
+                tiempos.append(segundos)
+                bytes_escritos += escritos
+            except Exception as e:
+                errores.append((futuros[futuro], e))
+            mostrar_progreso(terminados, len(tareas), inicio)
+
+    mostrar_estadisticas(tiempos, bytes_escritos, errores, time.perf_counter() - inicio, args.procesos)
\ No newline at end of file
@@ -0,0 +1,219 @@
+import io
+import hashlib
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+import matplotlib
+import matplotlib.pyplot as plt
+import matplotlib.ticker as mtick
+import analisis_ventas
+from analisis_ventas import calcular_matriz_bcg, clave_grafico, obtener_grafico, guardar_grafico
+
+# Chart functions for the sales dashboard and the PDF report.
+# They live in their own module so worker processes can import them and render in parallel.
+
+# Function for ranking clientes
+def plot_ranking_clientes(ventas_clientes):
+    ranking_clientes = ventas_clientes.groupby('nombre_cliente', observed=True)['total_venta'].sum().reset_index()
+    ranking_clientes = ranking_clientes.sort_values(by='total_venta', ascending=False)
+
+    num_clientes = len(ranking_clientes)
+    base_colors = plt.cm.tab20.colors
+    colors = list(itertools.islice(itertools.cycle(base_colors), num_clientes))
+
+    fig, ax = plt.subplots(figsize=(14, 6))
+    ax.bar(ranking_clientes['nombre_cliente'], ranking_clientes['total_venta'], color=colors)
+    ax.set_xticklabels(ranking_clientes['nombre_cliente'], rotation=45, ha='right')
+    ax.set_ylabel('Total de Ventas ($)')
+    ax.set_title('Ranking de Clientes por Total de Ventas')
+
+    formatter = mtick.StrMethodFormatter('${x:,.0f}')
+    ax.yaxis.set_major_formatter(formatter)
+
+    return fig
+
+# Function for ventas mensuales
+def plot_ventas_mensuales(ventas_clientes):
+    ventas_por_mes = ventas_clientes.groupby('periodo')['total_venta'].sum().reset_index(name='total_venta')
+    ventas_por_mes.set_index('periodo', inplace=True)
+
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ventas_por_mes['total_venta'].plot(kind='line', ax=ax)
+    ax.set_title('Ventas mensuales')
+    ax.set_ylabel('Total Facturado (ARS)')
+    ax.grid(True)
+
+    formatter = mtick.StrMethodFormatter('${x:,.0f}')
+    ax.yaxis.set_major_formatter(formatter)
+
+    return fig
+
+# Function for ventas semanales septiembre
+def plot_ventas_semanales_septiembre(ventas_clientes):
+    septiembre_ventas = ventas_clientes[ventas_clientes['mes'] == 9]
+    ventas_semanales_septiembre = septiembre_ventas.groupby('semana')['total_venta'].sum().reset_index()
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.plot(ventas_semanales_septiembre['semana'], ventas_semanales_septiembre['total_venta'], marker='o', linestyle='-')
+    ax.set_xlabel('Semana de Septiembre')
+    ax.set_ylabel('Total de Ventas (ARS)')
+    ax.set_title('Ventas Semanales en Septiembre')
+    ax.grid(True)
+    ax.set_xticks(ventas_semanales_septiembre['semana'])
+
+    formatter = mtick.StrMethodFormatter('${x:,.0f}')
+    ax.yaxis.set_major_formatter(formatter)
+
+    return fig
+
+# Function for ventas por rubro
+def plot_ventas_por_rubro(detalle):
+    ventas_por_rubro_importe = detalle.groupby('nombre_rubro', observed=True)['importe'].sum().reset_index()
+
+    fig, ax = plt.subplots(figsize=(8, 8))
+    ax.pie(ventas_por_rubro_importe['importe'], labels=ventas_por_rubro_importe['nombre_rubro'], autopct='%1.1f%%', startangle=140)
+    ax.set_title('Porcentaje de Ventas por Rubro')
+    ax.axis('equal')
+
+    return fig
+
+# Function for ranking productos
+def plot_ranking_productos(detalle):
+    ranking_productos = detalle.groupby('descripcion', observed=True)['importe'].sum().reset_index()
+    ranking_productos = ranking_productos.sort_values(by='importe', ascending=False)
+
+    num_productos = len(ranking_productos)
+    base_colors = plt.cm.tab20.colors
+    colors = list(itertools.islice(itertools.cycle(base_colors), num_productos))
+
+    fig, ax = plt.subplots(figsize=(14, 7))
+    ax.bar(ranking_productos['descripcion'], ranking_productos['importe'], color=colors)
+    ax.set_xticklabels(ranking_productos['descripcion'], rotation=90, ha='right')
+    ax.set_xlabel('Producto')
+    ax.set_ylabel('Total Facturado (ARS)')
+    ax.set_title('Ranking de Productos por Total Facturado')
+    ax.grid(axis='y')
+
+    formatter = mtick.StrMethodFormatter('${x:,.0f}')
+    ax.yaxis.set_major_formatter(formatter)
+
+    return fig
+
+# Function for BCG matrix
+def plot_bcg_matrix(detalle):
+    ingresos_mes = detalle.groupby(['descripcion', 'periodo'], observed=True)['importe'].sum().reset_index()
+    pivot = ingresos_mes.pivot(index='descripcion', columns='periodo', values='importe').fillna(0)
+    pivot.columns = pivot.columns.astype(str)
+
+    pivot, avg_income, avg_growth = calcular_matriz_bcg(pivot)
+
+    fig, ax = plt.subplots(figsize=(12, 7))
+    for quadrant, color in zip(pivot['cuadrante'].unique(), pivot['color'].unique()):
+        subset = pivot[pivot['cuadrante'] == quadrant]
+        ax.scatter(subset['crecimiento'] * 100, subset['ingresos_totales'] / 1_000_000, s=300, alpha=0.7, color=color, label=quadrant)
+
+    for i, producto in enumerate(pivot.index):
+        ax.text(pivot['crecimiento'].iloc[i] * 100, pivot['ingresos_totales'].iloc[i] / 1_000_000, producto, fontsize=8, ha='center')
+
+    ax.axhline(y=avg_income / 1_000_000, color='gray', linestyle='--')
+    ax.axvline(x=avg_growth * 100, color='gray', linestyle='--')
+
+    ax.text(avg_growth * 100, (pivot['ingresos_totales'].max() + avg_income) / 2 / 1_000_000, 'Estrellas', fontsize=12, ha='left', va='center', color='green')
+    ax.text(avg_growth * 100, (pivot['ingresos_totales'].min() + avg_income) / 2 / 1_000_000, 'Interrogantes', fontsize=12, ha='left', va='center', color='orange')
+    ax.text((pivot['crecimiento'].max() + avg_growth) / 2 * 100, avg_income / 1_000_000, 'Vacas Lecheras', fontsize=12, ha='center', va='bottom', color='blue')
+    ax.text((pivot['crecimiento'].min() + avg_growth) / 2 * 100, avg_income / 1_000_000, 'Perros', fontsize=12, ha='center', va='bottom', color='red')
+
+    ax.set_xlabel('Crecimiento mensual (%)')
+    ax.set_ylabel('Ingresos totales (millones $)')
+    ax.set_title('Matriz BCG por Producto')
+    ax.grid(True)
+    ax.legend(title='Cuadrante')
+
+    return fig
+
+# Function for the monthly spending history of one client
+def plot_historico_cliente(ventas_clientes, cliente, figsize=(10, 5)):
+    cliente_data = ventas_clientes[ventas_clientes['nombre_cliente'] == cliente]
+    cliente_data = cliente_data.groupby('periodo')['total_venta'].sum().reset_index()
+    cliente_data.set_index('periodo', inplace=True)
+
+    fig, ax = plt.subplots(figsize=figsize)
+    cliente_data['total_venta'].plot(kind='line', ax=ax, marker='o')
+    ax.set_title(f'Histórico de Gasto de {cliente}')
+    ax.set_ylabel('Total Gasto (ARS)')
+    ax.grid(True)
+
+    formatter = mtick.StrMethodFormatter('${x:,.0f}')
+    ax.yaxis.set_major_formatter(formatter)
+
+    return fig
+
+# Function to set up each worker process: charts are drawn off-screen
+def _iniciar_proceso():
+    matplotlib.use('Agg')
+
+# Function to create the pool of worker processes that render the charts
+# 'spawn' is used so workers never inherit the state of the Streamlit server threads
+def crear_pool(procesos=None):
+    if procesos is None:
+        procesos = min(6, os.cpu_count() or 1)
+    return ProcessPoolExecutor(max_workers=procesos, mp_context=multiprocessing.get_context('spawn'),
+                               initializer=_iniciar_proceso)
+
+# Function to render one chart to PNG bytes
+def renderizar_png(plot_func, args, dpi=100):
+    fig = plot_func(*args)
+    img_buffer = io.BytesIO()
+    fig.savefig(img_buffer, format='png', bbox_inches='tight', dpi=dpi)
+    plt.close(fig)
+    return img_buffer.getvalue()
+
+# Signature of the chart code: hash of the source of this module and of analisis_ventas,
+# where the helpers used by the charts live (e.g. calcular_matriz_bcg)
+# Editing any chart, its styling or a helper invalidates the cached images, and the key is the same in every process
+def _firma_codigo(*rutas):
+    firma = hashlib.sha256()
+    for ruta in rutas:
+        with open(ruta, 'rb') as fuente:
+            firma.update(fuente.read())
+    return firma.hexdigest()
+
+FIRMA_CODIGO = _firma_codigo(__file__, analisis_ventas.__file__)
+
+# Function to build the cache key of a chart from its function, its input data and the dpi
+def clave_png(plot_func, args, dpi):
+    return clave_grafico(plot_func.__qualname__, *args, codigo=FIRMA_CODIGO, dpi=dpi, formato='png')
+
+# Function to store a rendered chart once its Future finishes without errors
+def _guardar_al_terminar(clave):
+    def guardar(futuro):
+        if not futuro.cancelled() and futuro.exception() is None:
+            guardar_grafico(clave, futuro.result())
+    return guardar
+
+# Function to send several charts to the pool at once
+# graficos maps a name to (plot_func, args); returns a dict name -> Future with the PNG bytes
+# Charts already in the image cache are not rendered again: their Future is returned already resolved
+# With pool=None the charts are rendered in the current process (e.g. when already running inside a worker)
+def enviar_graficos(pool, graficos, dpi=100):
+    futuros = {}
+    for nombre, (plot_func, args) in graficos.items():
+        clave = clave_png(plot_func, args, dpi)
+        contenido = obtener_grafico(clave)
+        if contenido is None and pool is None:
+            contenido = renderizar_png(plot_func, args, dpi)
+            guardar_grafico(clave, contenido)
+        if contenido is not None:
+            futuros[nombre] = Future()
+            futuros[nombre].set_result(contenido)
+        else:
+            futuros[nombre] = pool.submit(renderizar_png, plot_func, args, dpi)
+            futuros[nombre].add_done_callback(_guardar_al_terminar(clave))
+    return futuros
+
+# Function to render several charts in parallel and wait for all of them
+# Total time is that of the slowest chart instead of the sum of all of them
+def renderizar_graficos(pool, graficos, dpi=100):
+    futuros = enviar_graficos(pool, graficos, dpi)
+    return {nombre: futuro.result() for nombre, futuro in futuros.items()}
\ No newline at end of file
@@ -0,0 +1,125 @@
+import io
+import pandas as pd
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image
+from analisis_ventas import obtener_hechos, construir_cubo, construir_cubo_ventas
+from graficos import (plot_ranking_clientes, plot_ventas_mensuales, plot_ventas_semanales_septiembre,
+                      plot_ventas_por_rubro, plot_ranking_productos, plot_bcg_matrix, plot_historico_cliente,
+                      renderizar_graficos)
+from instrumentacion import instrumentar
+
+# Data preparation and report generation shared by the Streamlit app (app.py)
+# and the batch report generator (generar_reportes.py)
+
+# Function to load data
+@instrumentar(filas=lambda tablas: len(tablas[0]) + len(tablas[1]))
+def load_data(productos, rubros, clientes, facturas_encabezados, facturas_detalles, ventas):
+    # Merge data as in notebook
+    ventas_clientes = pd.merge(ventas, facturas_encabezados, on='id_factura', how='left')
+    ventas_clientes = pd.merge(ventas_clientes, clientes, on='id_cliente', how='left')
+    ventas_clientes = ventas_clientes.rename(columns={'nombre': 'nombre_cliente', 'monto': 'total_venta'})
+
+    # Convert fecha
+    ventas_clientes['fecha'] = pd.to_datetime(ventas_clientes['fecha'], format='%d/%m/%Y')
+
+    # Detail lines already joined with invoice date, client, product and rubro (fact table)
+    detalle = obtener_hechos(productos, rubros, clientes, facturas_encabezados, facturas_detalles)
+
+    return ventas_clientes, detalle
+
+# Function to build the pre-aggregated cubes the filters and charts slice instead of the raw rows
+@instrumentar(filas=lambda cubos: len(cubos[0]) + len(cubos[1]))
+def construir_cubos(productos, rubros, clientes, facturas_encabezados, facturas_detalles, ventas):
+    ventas_clientes, detalle = load_data(productos, rubros, clientes, facturas_encabezados, facturas_detalles, ventas)
+    return construir_cubo_ventas(ventas_clientes), construir_cubo(detalle)
+
+# Functions for the client and product rankings offered as downloads
+def ranking_clientes(filtered_ventas):
+    return filtered_ventas.groupby('nombre_cliente', observed=True)['total_venta'].sum().reset_index().sort_values(by='total_venta', ascending=False)
+
+def ranking_productos(filtered_detalle):
+    return filtered_detalle.groupby('descripcion', observed=True)['importe'].sum().reset_index().sort_values(by='importe', ascending=False)
+
+# Function to generate CSV
+@instrumentar(filas=None, bytes_resultado=True)
+def generate_csv(data):
+    return data.to_csv(index=False).encode()
+
+# Function to generate JSON
+@instrumentar(filas=None, bytes_resultado=True)
+def generate_json(data):
+    return data.to_json(orient='records').encode()
+
+# Function to generate PDF with all plots
+@instrumentar(filas=None, bytes_resultado=True)
+def generate_pdf_report(pool, filtered_ventas, filtered_detalle, rubros, months, rubro, cliente):
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    styles = getSampleStyleSheet()
+    story = []
+
+    story.append(Paragraph("Informe de Ventas", styles['Title']))
+    story.append(Spacer(1, 12))
+
+    # Summary stats
+    total_ventas = filtered_ventas['total_venta'].sum()
+    story.append(Paragraph(f"Total de Ventas: ${total_ventas:,.2f}", styles['Normal']))
+    story.append(Spacer(1, 12))
+
+    # Ranking clientes
+    ranking_clientes = filtered_ventas.groupby('nombre_cliente', observed=True)['total_venta'].sum().reset_index().sort_values(by='total_venta', ascending=False).head(5)
+    story.append(Paragraph("Top 5 Clientes:", styles['Heading2']))
+    for _, row in ranking_clientes.iterrows():
+        story.append(Paragraph(f"{row['nombre_cliente']}: ${row['total_venta']:,.2f}", styles['Normal']))
+    story.append(Spacer(1, 12))
+
+    # Ranking productos
+    ranking_productos = filtered_detalle.groupby('descripcion', observed=True)['importe'].sum().reset_index().sort_values(by='importe', ascending=False).head(5)
+    story.append(Paragraph("Top 5 Productos:", styles['Heading2']))
+    for _, row in ranking_productos.iterrows():
+        story.append(Paragraph(f"{row['descripcion']}: ${row['importe']:,.2f}", styles['Normal']))
+    story.append(Spacer(1, 12))
+
+    # Add all plots
+    plots = [
+        ("Ranking de Clientes por Total de Ventas", plot_ranking_clientes, [filtered_ventas]),
+        ("Ventas Mensuales", plot_ventas_mensuales, [filtered_ventas]),
+    ]
+
+    if 9 in months:
+        plots.append(("Ventas Semanales en Septiembre", plot_ventas_semanales_septiembre, [filtered_ventas]))
+
+    plots.extend([
+        ("Porcentaje de Ventas por Rubro", plot_ventas_por_rubro, [filtered_detalle]),
+        ("Ranking de Productos por Total Facturado", plot_ranking_productos, [filtered_detalle]),
+        ("Matriz BCG por Producto", plot_bcg_matrix, [filtered_detalle])
+    ])
+
+    # Client historical plot
+    if cliente and (filtered_ventas['nombre_cliente'] == cliente).any():
+        plots.append((f'Histórico de Gasto de {cliente}', plot_historico_cliente, [filtered_ventas, cliente, (8, 6)]))
+
+    # Render every plot in parallel, then add them in order
+    imagenes = renderizar_graficos(pool, {title: (plot_func, args) for title, plot_func, args in plots}, dpi=100)
+    for title, _, _ in plots:
+        story.append(Paragraph(title, styles['Heading2']))
+        story.append(Spacer(1, 6))  # Reduce space
+        img = Image(io.BytesIO(imagenes[title]), width=350, height=250)  # Smaller size
+        story.append(img)
+        story.append(Spacer(1, 6))  # Reduce space
+
+    # If rubro selected, add products table
+    if rubro != "Todos":
+        story.append(Paragraph(f"Productos del Rubro: {rubro}", styles['Heading2']))
+        ventas_productos = filtered_detalle.groupby('descripcion', observed=True)['importe'].sum().reset_index().sort_values(by='importe', ascending=False)
+        # Simple table
+        data = [['Producto', 'Ventas']] + ventas_productos[['descripcion', 'importe']].values.tolist()
+        from reportlab.platypus import Table, TableStyle
+        table = Table(data)
+        table.setStyle(TableStyle([('BACKGROUND', (0, 0), (-1, 0), 'lightgrey'), ('GRID', (0, 0), (-1, -1), 1, 'black')]))
+        story.append(table)
+        story.append(Spacer(1, 12))
+
+    doc.build(story)
+    return buffer.getvalue()
\ No newline at end of file